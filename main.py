@@ -4,16 +4,13 @@
 import sys
 import argparse
 import logging
-from typing import Dict, Any, List
-
-from yomu.config.config import Config
-from yomu.database.database import Database
-from yomu.email.sender import EmailSender
-from yomu.content.processor import ContentProcessor
-from yomu.newsletter.service import NewsletterService
-from yomu.daemon.daemon import NewsletterDaemon
+from typing import Dict, Any, List, TYPE_CHECKING
+
+from yomu import __version__
 from yomu.utils import setup_logger, get_logger
-from hikugen.database import HikuDatabase
+
+if TYPE_CHECKING:
+    from yomu.config.config import Config
 
 logger = get_logger(__name__)
 
@@ -81,7 +78,7 @@ Examples:
         help="Clear cached extraction code for specific cache keys",
     )
 
-    parser.add_argument("--version", action="version", version="0.1.0")
+    parser.add_argument("-V", "--version", action="version", version=__version__)
 
     return parser.parse_args(args)
 
@@ -92,6 +89,8 @@ def initialize_database(db_path: str):
     Args:
         db_path: Path to SQLite database file
     """
+    from yomu.database.database import Database
+
     logger.info(f"Initializing database at {db_path}")
     with Database(db_path) as db:
         db.create_tables()
@@ -108,6 +107,8 @@ def clear_cache_for_keys(db_path: str, cache_keys: List[str]) -> int:
     Returns:
         Total number of cache entries deleted
     """
+    from hikugen.database import HikuDatabase
+
     logger.info(f"Clearing Hikugen cache for {len(cache_keys)} cache key(s)")
     hiku_db = HikuDatabase(db_path)
     hiku_db.create_tables()
@@ -133,6 +134,8 @@ def clear_all_cache(db_path: str) -> int:
     Returns:
         Total number of cache entries deleted
     """
+    from hikugen.database import HikuDatabase
+
     hiku_db = HikuDatabase(db_path)
     hiku_db.create_tables()
     count = hiku_db.clear_all_cache()
@@ -141,7 +144,7 @@ def clear_all_cache(db_path: str) -> int:
     return count
 
 
-def create_app_components(config: Config, db_path: str) -> Dict[str, Any]:
+def create_app_components(config: "Config", db_path: str) -> Dict[str, Any]:
     """Create and wire together all application components.
 
     Args:
@@ -151,6 +154,12 @@ def create_app_components(config: Config, db_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary of initialized components
     """
+    from yomu.database.database import Database
+    from yomu.email.sender import EmailSender
+    from yomu.content.processor import ContentProcessor
+    from yomu.newsletter.service import NewsletterService
+    from yomu.daemon.daemon import NewsletterDaemon
+
     database = Database(db_path)
 
     email_sender = EmailSender(config)
@@ -176,6 +185,11 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    # Answer version queries before argparse or any component is touched
+    if len(sys.argv) == 2 and sys.argv[1] in ("--version", "-V"):
+        print(__version__)
+        return 0
+
     try:
         args = parse_arguments()
 
@@ -197,6 +211,8 @@ def main() -> int:
             initialize_database(args.db_path)
             return 0
 
+        from yomu.config.config import Config
+
         config = Config.load_from_file(args.config_file)
 
         components = create_app_components(config, args.db_path)
@@ -4,12 +4,52 @@
 import os
 import re
 import yaml
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, List
 from urllib.parse import urlparse
 from croniter import croniter
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# Raw YAML field rules: (name, required, expected type, extra check, error message)
+_FIELD_SCHEMA = (
+    ("openrouter_api_key", True, None, None, None),
+    ("sender_email", True, None, None, None),
+    ("sender_password", True, None, None, None),
+    ("recipient_email", True, None, None, None),
+    ("sources", True, list, None, "Invalid field type: sources must be a list"),
+    ("frequencies", True, list, None, "Invalid field type: frequencies must be a list"),
+    (
+        "max_description_length",
+        False,
+        int,
+        lambda value: value > 0,
+        "max_description_length must be a positive integer",
+    ),
+)
+
+
+def parse_schedules(frequencies: List[str]) -> List[croniter]:
+    """Parse cron expressions into iterators based at the current time.
+
+    Args:
+        frequencies: Cron expressions to parse
+
+    Returns:
+        One cron iterator per expression, in the same order
+
+    Raises:
+        ValueError: If any cron expression cannot be parsed
+    """
+    now = datetime.now()
+    return [croniter(frequency, now) for frequency in frequencies]
+
 
 class ConfigError(Exception):
     """Raised when required configuration is missing or invalid."""
@@ -17,7 +57,7 @@ class ConfigError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Unified configuration for Yomu application loaded from YAML."""
 
@@ -36,6 +76,9 @@ class Config:
     max_articles_per_source: int = 3
     max_description_length: int = 200
 
+    # (expression, iterator) pairs parsed during validation, served by crons()
+    _validated_crons: tuple = field(default=(), init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize default values for mutable fields."""
         if self.sources is None:
@@ -47,10 +90,26 @@ class Config:
     def load_from_file(cls, config_path: str) -> "Config":
         """Load configuration from YAML file with validation."""
         data = cls._load_yaml_data(config_path)
-        cls._validate_required_fields(data)
-        cls._validate_field_types(data)
-        cls._validate_optional_fields(data)
+        cls._validate_data(data)
+        return cls._from_data(data)
+
+    @classmethod
+    def load_from_string(cls, text: str) -> "Config":
+        """Load configuration from YAML text with validation.
+
+        Args:
+            text: YAML configuration document
 
+        Returns:
+            Validated Config instance
+        """
+        data = cls._parse_yaml(text)
+        cls._validate_data(data)
+        return cls._from_data(data)
+
+    @classmethod
+    def _from_data(cls, data: dict) -> "Config":
+        """Build and validate a Config from field-checked raw data."""
         config = cls(
             openrouter_api_key=data["openrouter_api_key"],
             sender_email=data["sender_email"],
@@ -74,46 +133,31 @@ class Config:
         if not os.path.exists(config_path):
             raise FileNotFoundError("Configuration file not found")
 
+        with open(config_path, "r", encoding="utf-8") as f:
+            return Config._parse_yaml(f.read())
+
+    @staticmethod
+    def _parse_yaml(text: str) -> Any:
+        """Parse YAML text, reporting syntax errors as ValueError."""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return yaml.load(text, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML syntax: {e}")
 
     @staticmethod
-    def _validate_required_fields(data: dict) -> None:
-        """Validate that all required fields are present."""
-        required_fields = [
-            "openrouter_api_key",
-            "sender_email",
-            "sender_password",
-            "recipient_email",
-            "sources",
-            "frequencies",
-        ]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field: {field}")
-
-    @staticmethod
-    def _validate_field_types(data: dict) -> None:
-        """Validate that field types are correct."""
-        if not isinstance(data["sources"], list):
-            raise ValueError("Invalid field type: sources must be a list")
-
-        if not isinstance(data["frequencies"], list):
-            raise ValueError("Invalid field type: frequencies must be a list")
-
-    @staticmethod
-    def _validate_optional_fields(data: dict) -> None:
-        """Validate optional fields if present."""
-        if "max_description_length" not in data:
-            return
-
-        if not isinstance(data["max_description_length"], int):
-            raise ValueError("max_description_length must be a positive integer")
-        if data["max_description_length"] <= 0:
-            raise ValueError("max_description_length must be a positive integer")
+    def _validate_data(data: dict) -> None:
+        """Validate presence, types and ranges of raw fields in a single pass."""
+        for name, required, expected_type, check, error in _FIELD_SCHEMA:
+            if name not in data:
+                if required:
+                    raise ValueError(f"Missing required field: {name}")
+                continue
+
+            value = data[name]
+            if expected_type is not None and not isinstance(value, expected_type):
+                raise ValueError(error)
+            if check is not None and not check(value):
+                raise ValueError(error)
 
     def validate(self) -> None:
         """Validate configuration values."""
@@ -130,14 +174,13 @@ class Config:
             raise ValueError("SMTP port must be an integer between 1 and 65535")
 
         # Validate email fields
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
         if not self.sender_email:
             raise ValueError("Sender email cannot be empty")
-        if not re.match(email_pattern, self.sender_email):
+        if not _EMAIL_RE.match(self.sender_email):
             raise ValueError("Invalid email format")
         if not self.recipient_email:
             raise ValueError("Recipient email cannot be empty")
-        if not re.match(email_pattern, self.recipient_email):
+        if not _EMAIL_RE.match(self.recipient_email):
             raise ValueError("Invalid email format")
 
         # Validate sources and frequencies
@@ -178,15 +221,32 @@ class Config:
         if not isinstance(self.frequencies, list):
             raise ValueError("Frequencies must be a list")
 
-        # Validate each cron expression
         for frequency in self.frequencies:
             if not frequency:
                 raise ValueError("Frequency cannot be empty")
 
-            # Validate cron expression syntax
-            try:
-                croniter(frequency, datetime.now())
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Invalid cron expression: {e}")
+        # Validate cron expression syntax, keeping the parsed iterators
+        try:
+            validated_crons = parse_schedules(self.frequencies)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cron expression: {e}")
+
+        self._validated_crons = tuple(zip(self.frequencies, validated_crons))
+
+    def crons(self) -> List[croniter]:
+        """Get cron iterators for the configured frequencies, in order.
+
+        Iterators parsed by validate() are reused only while they were parsed
+        from the current frequencies; otherwise the expressions are parsed again.
+
+        Returns:
+            One cron iterator per frequency
+
+        Raises:
+            ValueError: If any frequency cannot be parsed
+        """
+        validated = self._validated_crons
+        if [expression for expression, _ in validated] == list(self.frequencies):
+            return [cron for _, cron in validated]
 
-            # Cron expression syntax is valid
+        return parse_schedules(self.frequencies)
@@ -2,10 +2,11 @@
 # ABOUTME: Provides content processing (feeds + HTML pages), article extraction, and filtering
 
 from yomu.content.processor import ContentProcessor
-from yomu.content.schema import ContentFeed, ContentChannel, ContentItem
+from yomu.content.schema import Article, ContentFeed, ContentChannel, ContentItem
 
 __all__ = [
     "ContentProcessor",
+    "Article",
     "ContentFeed",
     "ContentChannel",
     "ContentItem",
@@ -1,11 +1,11 @@
 # ABOUTME: Content processing pipeline delegating extraction to Hiku
 # ABOUTME: Handles timestamp filtering, deduplication, and source tracking
 
-from collections import deque
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
-from hikugen import HikuExtractor
-from yomu.content.schema import ContentFeed
+from typing import List, Dict, Any, Iterator, Optional
+from yomu.content.schema import Article, ContentFeed
 from yomu.database.database import Database
 from yomu.utils import (
     get_logger,
@@ -15,6 +15,68 @@ from yomu.utils import (
 )
 
 
+class BoundedUrlSet:
+    """LRU-ordered URL set that evicts its least recently seen entry once full."""
+
+    def __init__(self, maxlen: Optional[int]):
+        """Initialize an empty set holding at most maxlen URLs.
+
+        Args:
+            maxlen: Maximum number of URLs to keep (None for unbounded)
+        """
+        self._maxlen = maxlen
+        # Keys only; ordered from least to most recently seen
+        self._urls: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        """Maximum number of URLs kept before the oldest is evicted."""
+        return self._maxlen
+
+    def add(self, url: str) -> None:
+        """Remember a URL as most recently seen, evicting the oldest when full.
+
+        Args:
+            url: URL to remember
+        """
+        with self._lock:
+            urls = self._urls
+            if url in urls:
+                urls.move_to_end(url)
+                return
+            if self._maxlen == 0:
+                return
+            urls[url] = None
+            if self._maxlen is not None and len(urls) > self._maxlen:
+                urls.popitem(last=False)
+
+    def refresh(self, url: str) -> bool:
+        """Mark a remembered URL as most recently seen.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            True if the URL was remembered, False otherwise
+        """
+        with self._lock:
+            try:
+                self._urls.move_to_end(url)
+            except KeyError:
+                return False
+            return True
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._urls))
+
+
 class ContentProcessor:
     """Content processing pipeline handling both content feeds and HTML pages with LLM extraction."""
 
@@ -24,6 +86,7 @@ class ContentProcessor:
         database: Database,
         db_path: str = "yomu.db",
         max_fallback_urls: Optional[int] = 1000,
+        extractor: Optional[Any] = None,
     ):
         """Initialize ContentProcessor with dependencies.
 
@@ -32,22 +95,73 @@ class ContentProcessor:
             database: Database operations instance
             db_path: Path to SQLite database file for Hikugen cache (default: yomu.db)
             max_fallback_urls: Maximum number of non-dated URLs to track (default: 1000)
+            extractor: Object providing HikuExtractor.extract (built from config on
+                first use if None)
         """
         self.config = config
         self.database = database
-        self.hiku_extractor = HikuExtractor(
-            api_key=config.openrouter_api_key,
-            db_path=db_path,
-        )
+        self._hiku_db_path = db_path
+        self._hiku_extractor = extractor
+        # HikuDatabase shares one unlocked sqlite3 connection, so every thread
+        # extracting concurrently gets its own HikuExtractor
+        self._thread_extractors = threading.local()
+        self._extractors: List[Any] = []
+        self._extractors_lock = threading.Lock()
         self.logger = get_logger(__name__)
         self.request_timeout = 10
-        self.non_dated_processed_urls = deque(maxlen=max_fallback_urls)
+        self.non_dated_processed_urls = BoundedUrlSet(max_fallback_urls)
+
+    @property
+    def hiku_extractor(self) -> Any:
+        """Extractor for the calling thread.
 
-    def process_source(self, source_url: str) -> List[Dict[str, Any]]:
+        An injected extractor is shared by all threads. Otherwise each thread
+        builds its own HikuExtractor from the config on first access.
+        """
+        if self._hiku_extractor is not None:
+            return self._hiku_extractor
+
+        extractor = getattr(self._thread_extractors, "extractor", None)
+        if extractor is None:
+            # Deferred so importing yomu.content doesn't pull in hikugen's HTTP/LLM stack
+            from hikugen import HikuExtractor
+
+            extractor = HikuExtractor(
+                api_key=self.config.openrouter_api_key,
+                db_path=self._hiku_db_path,
+            )
+            self._thread_extractors.extractor = extractor
+            with self._extractors_lock:
+                self._extractors.append(extractor)
+        return extractor
+
+    def close_extractors(self) -> None:
+        """Close the HikuExtractors built for the calling threads.
+
+        Called once a collection run's worker threads have finished, so their
+        cache connections are released before the daemon sleeps. Threads that
+        extract again build fresh extractors; an injected one is left open.
+        """
+        with self._extractors_lock:
+            extractors, self._extractors = self._extractors, []
+            self._thread_extractors = threading.local()
+        for extractor in extractors:
+            extractor.database.close()
+
+    def process_source(
+        self,
+        source_url: str,
+        known_sources: Optional[Dict[str, Dict[str, Any]]] = None,
+        record_run: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Article]:
         """Process a source URL and return filtered articles.
 
         Args:
             source_url: URL to process
+            known_sources: Prefetched source metadata keyed by URL (looked up if None)
+            record_run: Whether to store the run timestamp (False when the caller batches it)
+            limit: Stop filtering once this many articles are kept (None for no limit)
 
         Returns:
             List of filtered article dictionaries
@@ -68,53 +182,87 @@ class ContentProcessor:
         )
         articles = self._content_feed_to_articles(content_feed, source_url)
 
-        existing_source = self.database.get_source_by_url(source_url)
+        if known_sources is None:
+            existing_source = self.database.get_source_by_url(source_url)
+        else:
+            existing_source = known_sources.get(source_url)
         last_run = (
             existing_source.get("last_successful_run") if existing_source else None
         )
-        filtered_articles = self._filter_articles_by_timestamp(articles, last_run)
-
-        self.database.add_source(source_url)
-        self.database.update_source_last_run(
-            source_url, datetime.now(timezone.utc).replace(tzinfo=None)
+        filtered_articles = self._filter_articles_by_timestamp(
+            articles, last_run, limit
         )
 
+        if record_run:
+            self.database.upsert_source_run(
+                source_url, datetime.now(timezone.utc).replace(tzinfo=None)
+            )
+
         self.logger.info(f"Processed {source_url}: {len(filtered_articles)} articles")
         return filtered_articles
 
     def _filter_articles_by_timestamp(
-        self, articles: List[Dict[str, Any]], last_run_timestamp: Optional[str]
-    ) -> List[Dict[str, Any]]:
+        self,
+        articles: List[Article],
+        last_run_timestamp: Optional[str],
+        limit: Optional[int] = None,
+    ) -> List[Article]:
         """Filter articles to only include those newer than last successful run.
 
+        Articles after the limit is reached are not examined, so non-dated ones
+        among them are not remembered and remain eligible for a later run. Only
+        the first article carrying a given link is examined; repeats are dropped.
+
         Args:
             articles: List of articles to filter
             last_run_timestamp: ISO timestamp of last successful run (stored as UTC naive)
+            limit: Maximum number of articles to keep (None for no limit)
 
         Returns:
             Filtered list of articles
         """
 
         last_run_utc = parse_iso_timestamp(last_run_timestamp)
+        last_run_naive = last_run_utc.replace(tzinfo=None) if last_run_utc else None
 
         filtered_articles = []
         filtered_count = 0
 
-        for article in articles:
+        # Bind per-article lookups once for the hot loop
+        non_dated_urls = self.non_dated_processed_urls
+        should_include = self._should_include_article
+        append = filtered_articles.append
+        # Links already examined this batch; feeds can repeat an item verbatim
+        batch_links = set()
+
+        for index, article in enumerate(articles):
+            if limit is not None and len(filtered_articles) >= limit:
+                self.logger.info(
+                    f"Reached limit of {limit} articles, skipped {len(articles) - index} remaining"
+                )
+                break
+
             article_url = article.get("link", "")
-            if article_url and article_url in self.non_dated_processed_urls:
+            if article_url:
+                if article_url in batch_links:
+                    filtered_count += 1
+                    continue
+                batch_links.add(article_url)
+
+            # Refreshing on a hit keeps URLs still present in the feed from aging out
+            if article_url and non_dated_urls.refresh(article_url):
                 filtered_count += 1
                 continue
 
             try:
-                if self._should_include_article(article, last_run_utc):
-                    filtered_articles.append(article)
+                if should_include(article, last_run_naive):
+                    append(article)
                 else:
                     filtered_count += 1
             except Exception:
-                if article_url and article_url not in self.non_dated_processed_urls:
-                    self.non_dated_processed_urls.append(article_url)
-                filtered_articles.append(article)
+                if article_url:
+                    self._remember_nondated(article_url)
+                append(article)
 
         if filtered_count > 0:
             self.logger.info(
@@ -123,28 +271,33 @@ class ContentProcessor:
         return filtered_articles
 
     def _should_include_article(
-        self, article: Dict[str, Any], last_run_utc: Optional[datetime]
+        self, article: Article, last_run_naive: Optional[datetime]
     ) -> bool:
-        """Determine if article should be included after checking the deque"""
+        """Determine if article should be included after checking the seen URLs"""
 
         article_url = article.get("link", "")
         pub_date_str = article.get("pubDate", "")
         article_date = parse_date(pub_date_str)
 
-        if last_run_utc and article_date:
-            return normalize_datetime_to_utc_naive(article_date) > last_run_utc.replace(
-                tzinfo=None
-            )
+        if last_run_naive and article_date:
+            return normalize_datetime_to_utc_naive(article_date) > last_run_naive
 
-        if not article_date:
-            if article_url and article_url not in self.non_dated_processed_urls:
-                self.non_dated_processed_urls.append(article_url)
+        if not article_date and article_url:
+            self._remember_nondated(article_url)
 
         return True
 
+    def _remember_nondated(self, url: str) -> None:
+        """Track a non-dated article URL for fallback deduplication.
+
+        Args:
+            url: Article URL to remember
+        """
+        self.non_dated_processed_urls.add(url)
+
     def _content_feed_to_articles(
         self, content_feed: ContentFeed, source_url: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Article]:
         """Convert ContentFeed Pydantic model to article format.
 
         Args:
@@ -154,17 +307,15 @@ class ContentProcessor:
         Returns:
             List of article dictionaries in format
         """
-        articles = []
         source_title = content_feed.channel.title or source_url
 
-        for item in content_feed.items:
-            article = {
+        return [
+            {
                 "title": item.title or "No Title",
                 "link": item.link or "",
                 "description": item.description or "",
                 "pubDate": item.pubDate or "",
                 "source": source_title,
             }
-            articles.append(article)
-
-        return articles
+            for item in content_feed.items
+        ]
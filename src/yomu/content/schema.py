@@ -2,7 +2,7 @@
 # ABOUTME: Defines structure for Hiku-based content code generation
 
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, TypedDict
 
 
 class ContentItem(BaseModel):
@@ -39,3 +39,16 @@ class ContentFeed(BaseModel):
         min_length=1,
         description="List of content items. Focus on articles, news, posts and other things of the sort. Ignore other elements",
     )
+
+
+class Article(TypedDict):
+    """Article as passed from the processor to the newsletter template.
+
+    Kept as a plain dict at runtime; every field is always a string.
+    """
+
+    title: str
+    link: str
+    description: str
+    pubDate: str
+    source: str
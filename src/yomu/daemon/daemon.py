@@ -3,7 +3,7 @@
 
 import time
 from datetime import datetime
-from croniter import croniter
+from typing import Tuple
 from yomu.config.config import Config
 from yomu.newsletter.service import NewsletterService
 from yomu.utils import get_logger
@@ -26,29 +26,33 @@ class NewsletterDaemon:
         self.newsletter_service = newsletter_service
         self.logger = get_logger(__name__)
 
-        # Initialize cron iterators for multiple schedules - fail fast if invalid
-        self.crons = []
-        for frequency in self.config.frequencies:
-            cron = croniter(frequency, datetime.now())
-            self.crons.append(cron)
+        # Cron iterators for multiple schedules - fail fast if invalid
+        self.crons = self.config.crons()
 
     def run(self):
         """Run the main daemon loop with cron-based scheduling."""
         while True:
-            next_run_time = self._get_next_run_time()
-            current_time = datetime.now()
+            next_run_time, current_time = self._get_next_run_time()
             self.logger.info(f"Next newsletter scheduled for: {next_run_time}")
+            # Don't hold database handles open while idle
+            self.newsletter_service.flush_database()
             time.sleep((next_run_time - current_time).total_seconds())
             self.newsletter_service.send_newsletter_to_user(
                 self.config.recipient_email, self.config.sources
             )
 
-    def _get_next_run_time(self) -> datetime:
-        """Get the earliest next run time across all cron schedules."""
+    def _get_next_run_time(self) -> Tuple[datetime, datetime]:
+        """Get the earliest next run time across all cron schedules.
+
+        Returns:
+            Tuple of (earliest next run time, current time used as reference)
+        """
         current_time = datetime.now()
-        next_times = []
+        next_run_time = None
         for cron in self.crons:
             cron.set_current(current_time)
-            next_times.append(cron.get_next(datetime))
+            candidate = cron.get_next(datetime)
+            if next_run_time is None or candidate < next_run_time:
+                next_run_time = candidate
 
-        return min(next_times)
+        return next_run_time, current_time
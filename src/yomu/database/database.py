@@ -2,8 +2,9 @@
 # ABOUTME: Implements CRUD operations for source_metadata table with SQLite
 
 import sqlite3
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 SOURCE_METADATA_TABLE_SQL = """
     CREATE TABLE IF NOT EXISTS source_metadata (
@@ -12,6 +13,38 @@ SOURCE_METADATA_TABLE_SQL = """
     )
 """
 
+SOURCE_INSERT_SQL = """
+    INSERT INTO source_metadata (url, last_successful_run) VALUES (?, NULL)
+    ON CONFLICT(url) DO NOTHING
+"""
+
+SOURCE_BY_URL_SQL = "SELECT * FROM source_metadata WHERE url = ?"
+
+SOURCE_RUN_UPSERT_SQL = """
+    INSERT INTO source_metadata (url, last_successful_run) VALUES (?, ?)
+    ON CONFLICT(url) DO UPDATE SET last_successful_run = excluded.last_successful_run
+"""
+
+# WAL journaling with relaxed fsyncs and a larger in-memory page cache
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
+def _connect(database: str, pragmas: Tuple[str, ...]):
+    """Open a SQLite connection with row access by name and the given PRAGMAs."""
+    connection = sqlite3.connect(database, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    # Enable foreign key constraints
+    connection.execute("PRAGMA foreign_keys = ON")
+    for pragma in pragmas:
+        connection.execute(pragma)
+    return connection
+
 
 class Database:
     """SQLite database manager for Yomu newsletter application."""
@@ -23,10 +56,9 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self.connection = sqlite3.connect(db_path, check_same_thread=False)
-        self.connection.row_factory = sqlite3.Row
-        # Enable foreign key constraints
-        self.connection.execute("PRAGMA foreign_keys = ON")
+        # Shared read-write connection; writes are serialized through the lock
+        self.connection = _connect(db_path, CONNECTION_PRAGMAS)
+        self._lock = threading.Lock()
 
     def __enter__(self):
         """Context manager entry."""
@@ -41,13 +73,51 @@ class Database:
         if self.connection:
             self.connection.close()
 
-    def create_tables(self):
-        """Create source_metadata table for single-user architecture."""
-        cursor = self.connection.cursor()
+    def flush_and_close(self):
+        """Checkpoint the WAL and close all connections until the next use.
 
-        cursor.execute(SOURCE_METADATA_TABLE_SQL)
+        The shared connection is reopened lazily by the next operation, so the
+        daemon does not hold file handles while sleeping between cycles.
+        In-memory databases are left open since closing would discard them.
+        """
+        if self.db_path in ("", ":memory:"):
+            return
 
-        self.connection.commit()
+        with self._lock:
+            if self.connection:
+                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.connection.close()
+                self.connection = None
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get the shared read-write connection, reopening it if flushed.
+
+        Callers must hold the lock.
+
+        Returns:
+            Read-write connection
+        """
+        if self.connection is None:
+            self.connection = _connect(self.db_path, CONNECTION_PRAGMAS)
+        return self.connection
+
+    def _read(self, sql: str, params: Iterable[Any]) -> List[sqlite3.Row]:
+        """Run a read query on the shared connection.
+
+        Args:
+            sql: SELECT statement to run
+            params: Statement parameters
+
+        Returns:
+            All result rows
+        """
+        with self._lock:
+            return self._conn().execute(sql, params).fetchall()
+
+    def create_tables(self):
+        """Create source_metadata table for single-user architecture."""
+        with self._lock, self._conn() as connection:
+            connection.execute(SOURCE_METADATA_TABLE_SQL)
 
     def add_source(self, url: str):
         """Add a source to the database.
@@ -55,32 +125,35 @@ class Database:
         Args:
             url: Source URL (primary key)
         """
-        cursor = self.connection.cursor()
-
-        try:
-            cursor.execute(
-                "INSERT INTO source_metadata (url, last_successful_run) VALUES (?, NULL)",
-                (url,),
-            )
-        except sqlite3.IntegrityError:
-            # Source already exists, nothing to update
-            pass
+        with self._lock:
+            connection = self._conn()
+            connection.execute(SOURCE_INSERT_SQL, (url,))
+            connection.commit()
 
-        self.connection.commit()
-
-    def update_source_last_run(self, url: str, timestamp: datetime):
-        """Update source's last successful run timestamp.
+    def upsert_source_run(self, url: str, timestamp: datetime):
+        """Record a source's last successful run, creating the source if needed.
 
         Args:
             url: Source URL
             timestamp: Last successful extraction timestamp
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "UPDATE source_metadata SET last_successful_run = ? WHERE url = ?",
-            (timestamp.isoformat(), url),
-        )
-        self.connection.commit()
+        with self._lock:
+            connection = self._conn()
+            connection.execute(SOURCE_RUN_UPSERT_SQL, (url, timestamp.isoformat()))
+            connection.commit()
+
+    def bulk_upsert_runs(self, runs: Iterable[Tuple[str, datetime]]):
+        """Record last successful runs for several sources in one transaction.
+
+        Args:
+            runs: Pairs of (source URL, last successful extraction timestamp)
+        """
+        rows = [(url, timestamp.isoformat()) for url, timestamp in runs]
+        if not rows:
+            return
+
+        with self._lock, self._conn() as connection:
+            connection.executemany(SOURCE_RUN_UPSERT_SQL, rows)
 
     def get_source_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Get a source by its URL.
@@ -91,7 +164,23 @@ class Database:
         Returns:
             Source dictionary or None if not found
         """
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM source_metadata WHERE url = ?", (url,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        rows = self._read(SOURCE_BY_URL_SQL, (url,))
+        return dict(rows[0]) if rows else None
+
+    def get_sources_by_urls(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several sources with a single query.
+
+        Args:
+            urls: Source URLs to look up
+
+        Returns:
+            Dictionary mapping URL to source dictionary for URLs that exist
+        """
+        if not urls:
+            return {}
+
+        placeholders = ",".join("?" * len(urls))
+        rows = self._read(
+            f"SELECT * FROM source_metadata WHERE url IN ({placeholders})", list(urls)
+        )
+        return {row["url"]: dict(row) for row in rows}
@@ -2,24 +2,36 @@
 # ABOUTME: Implements EmailSender class for sending HTML newsletters via configurable SMTP
 
 import smtplib
-from email.mime.text import MIMEText
+from email.message import EmailMessage
 from email.utils import formatdate, make_msgid
-from typing import Any
+from typing import Any, Callable, Optional
+
+# Seconds before a blocking SMTP operation (connect, login, send) gives up
+SMTP_TIMEOUT = 30
 
 
 class EmailSender:
     """SMTP email sender for HTML newsletter distribution."""
 
-    def __init__(self, config: Any):
+    def __init__(
+        self,
+        config: Any,
+        smtp_factory: Optional[Callable[..., smtplib.SMTP]] = None,
+    ):
         """Initialize EmailSender with configuration.
 
         Args:
             config: Configuration object with sender_email, sender_password, smtp_server, and smtp_port
+            smtp_factory: Callable opening an SMTP connection from host, port and a
+                timeout keyword (default: smtplib.SMTP)
         """
         self.sender_email = config.sender_email
         self.sender_password = config.sender_password
         self.smtp_server = config.smtp_server
         self.smtp_port = config.smtp_port
+        # Explicit Message-ID domain avoids a socket.getfqdn() lookup per send
+        self._msgid_domain = self.sender_email.partition("@")[2] or None
+        self._smtp_factory = smtp_factory
 
     def send_email(self, to_email: str, subject: str, body: str):
         """Send HTML email via SMTP.
@@ -34,18 +46,23 @@ class EmailSender:
             EmailError: If SMTP operation fails
         """
         # Create email message
-        message = MIMEText(body, "html", "utf-8")
+        message = EmailMessage()
         message["From"] = self.sender_email
         message["To"] = to_email
         message["Subject"] = subject
         message["Date"] = formatdate(localtime=True)
-        message["Message-ID"] = make_msgid()
+        message["Message-ID"] = make_msgid(domain=self._msgid_domain)
+        message.set_content(body, subtype="html", charset="utf-8")
 
         # Send via SMTP
         server = None
         try:
-            # Connect to SMTP server
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            # Resolved per send so the default follows smtplib.SMTP at call time
+            smtp_factory = self._smtp_factory or smtplib.SMTP
+            # A timeout keeps a half-open socket from hanging the daemon forever
+            server = smtp_factory(
+                self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT
+            )
             server.starttls()
             server.login(self.sender_email, self.sender_password)
 
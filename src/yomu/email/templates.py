@@ -1,55 +1,71 @@
 # ABOUTME: HTML email template generation for modern minimalist newsletters
 # ABOUTME: Provides clean, responsive email templates with professional typography
 
-import html
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from operator import itemgetter
+from typing import List, Dict, Any, Final, Optional, Tuple, TYPE_CHECKING
 from yomu.utils import truncate_description, format_readable_date
 
 if TYPE_CHECKING:
     from yomu.config.config import Config
+    from yomu.content.schema import Article
 
 
-class HTMLTemplate:
-    """Modern minimalist HTML email template generator."""
+def _esc(text: str) -> str:
+    """Escape text for safe inclusion in HTML content and attributes.
 
-    def __init__(self, config: Optional["Config"] = None):
-        """Initialize HTMLTemplate with base styles and optional configuration.
+    Performs the same replacements as html.escape(quote=True), using chained
+    str.replace passes that return the input unchanged when nothing matches.
 
-        Args:
-            config: Optional configuration object for template customization
-        """
-        self.config = config
-        self.base_styles = self._get_base_styles()
+    Args:
+        text: Raw text to escape
 
-    def generate_newsletter(
-        self, articles_by_source: Dict[str, List[Dict[str, Any]]]
-    ) -> str:
-        """Generate complete HTML newsletter from articles.
+    Returns:
+        HTML-escaped text
+    """
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#x27;")
+    )
 
-        Args:
-            articles_by_source: Dictionary mapping source names to article lists
 
-        Returns:
-            Complete HTML email content
-        """
-        if not articles_by_source:
-            return self._generate_empty_newsletter()
+def _attr(text: str) -> str:
+    """Escape text for use inside a double-quoted HTML attribute value.
 
-        # Generate newsletter sections
-        header = self._generate_header()
-        content = self._generate_content(articles_by_source)
-        footer = self._generate_footer()
+    Only &, " and < need escaping there.
 
-        # Combine into complete HTML document
-        return self._wrap_in_html_document(header + content + footer)
+    Args:
+        text: Raw attribute value, such as a URL
 
-    def _get_base_styles(self) -> str:
-        """Get base CSS styles for the email template.
+    Returns:
+        Attribute-escaped text
+    """
+    return text.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;")
 
-        Returns:
-            CSS styles as string
-        """
-        return """
+
+# Fetches the rendered article fields in one C-level call
+_article_fields = itemgetter("title", "link", "description", "pubDate")
+
+# Fixed markup fragments appended around the escaped per-item values
+_SOURCE_SECTION_OPEN = (
+    '<div class="source-section">\n            <h2 class="source-header">'
+)
+_SOURCE_SECTION_BODY = "</h2>\n            "
+_SOURCE_SECTION_CLOSE = "\n        </div>"
+_ARTICLE_OPEN = '<div class="article">\n            '
+_ARTICLE_TITLE_OPEN = '\n            <h3 class="article-title">'
+_ARTICLE_TITLE_CLOSE = "</h3>\n            "
+_ARTICLE_CLOSE = "\n        </div>"
+_LINK_OPEN = '<a href="'
+_LINK_TARGET = '" target="_blank">'
+_LINK_CLOSE = "</a>"
+_DATE_OPEN = '<div class="article-date">'
+_DESCRIPTION_OPEN = '<div class="article-description">'
+_DIV_CLOSE = "</div>"
+
+_BASE_STYLES: Final = """
         <style>
             /* Reset and base styles */
             * {
@@ -220,98 +236,180 @@ class HTMLTemplate:
         </style>
         """
 
-    def _generate_header(self) -> str:
-        """Generate newsletter header.
-
-        Returns:
-            HTML header content
-        """
-        return """<div class="header">
+_HEADER_HTML: Final = """<div class="header">
             <h1>Your Newsletter</h1>
         </div>"""
 
-    def _generate_content(
+_FOOTER_HTML: Final = """<div class="footer">
+            <p>You're receiving this newsletter because you subscribed via email.</p>
+            <p>Generated by <a href="#">Yomu Newsletter</a></p>
+        </div>"""
+
+_EMPTY_CONTENT_HTML: Final = """
+        <div style="text-align: center; padding: 40px 20px; color: #666666;">
+            <p>No new articles this time. Check back later!</p>
+        </div>
+        """
+
+# Document skeleton with the styles inlined once at import
+_DOC_PREFIX: Final = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta http-equiv="X-UA-Compatible" content="IE=edge">
+    <title>Your Newsletter</title>
+    {_BASE_STYLES}
+</head>
+<body>
+    <div class="newsletter-container">
+        """
+
+_DOC_SUFFIX: Final = """
+    </div>
+</body>
+</html>"""
+
+_EMPTY_NEWSLETTER_HTML: Final = (
+    _DOC_PREFIX + _HEADER_HTML + _EMPTY_CONTENT_HTML + _FOOTER_HTML + _DOC_SUFFIX
+)
+
+
+# (source name, articles, source URL or None)
+_SourceEntry = Tuple[str, List["Article"], Optional[str]]
+
+
+def _normalize_sources(articles_by_source: Dict[str, Any]) -> List[_SourceEntry]:
+    """Flatten both source data shapes into (name, articles, url) entries.
+
+    Accepts the current {"url": url, "articles": articles} structure and the
+    older plain article list, and drops sources without articles.
+
+    Args:
+        articles_by_source: Dictionary mapping source names to article data
+
+    Returns:
+        List of (source name, articles, source URL or None) in source order
+    """
+    sources = []
+    # Preserve source order from config (dict maintains insertion order)
+    for source_name, source_data in articles_by_source.items():
+        if isinstance(source_data, dict) and "articles" in source_data:
+            articles = source_data["articles"]
+            source_url = source_data.get("url")
+        else:
+            # Old structure (backward compatibility)
+            articles = source_data
+            source_url = None
+
+        if articles:
+            sources.append((source_name, articles, source_url))
+    return sources
+
+
+class HTMLTemplate:
+    """Modern minimalist HTML email template generator."""
+
+    def __init__(self, config: Optional["Config"] = None):
+        """Initialize HTMLTemplate with optional configuration.
+
+        Args:
+            config: Optional configuration object for template customization
+        """
+        self.config = config
+
+    def generate_newsletter(
         self, articles_by_source: Dict[str, List[Dict[str, Any]]]
     ) -> str:
-        """Generate main newsletter content from articles.
+        """Generate complete HTML newsletter from articles.
 
         Args:
             articles_by_source: Dictionary mapping source names to article lists
 
         Returns:
-            HTML content for articles
+            Complete HTML email content
         """
-        content_parts = []
-
-        # Preserve source order from config (dict maintains insertion order)
-        for source_name in articles_by_source.keys():
-            source_data = articles_by_source[source_name]
-
-            # Handle both new structure {"url": url, "articles": articles} and old structure [articles]
-            if isinstance(source_data, dict) and "articles" in source_data:
-                # New structure with URL
-                articles = source_data["articles"]
-                source_url = source_data.get("url")
-            else:
-                # Old structure (backward compatibility)
-                articles = source_data
-                source_url = None
-
-            if not articles:
-                continue
-
-            content_parts.append(
-                self._generate_source_section(source_name, articles, source_url)
-            )
+        if not articles_by_source:
+            return self._generate_empty_newsletter()
+
+        # Resolve both input shapes up front so rendering sees a single one
+        sources = _normalize_sources(articles_by_source)
+
+        # Every section appends into one buffer that is joined exactly once
+        out = [_DOC_PREFIX, _HEADER_HTML]
+        self._generate_content(sources, out)
+        out.append(_FOOTER_HTML)
+        out.append(_DOC_SUFFIX)
+        return "".join(out)
+
+    def _generate_content(self, sources: List[_SourceEntry], out: List[str]) -> None:
+        """Append main newsletter content from articles.
 
-        return "\n".join(content_parts)
+        Args:
+            sources: Normalized (name, articles, url) entries in display order
+            out: Output buffer the HTML fragments are appended to
+        """
+        for index, (source_name, articles, source_url) in enumerate(sources):
+            if index:
+                out.append("\n")
+            self._generate_source_section(source_name, articles, source_url, out)
 
     def _generate_source_section(
-        self, source_name: str, articles: List[Dict[str, Any]], source_url: str = None
-    ) -> str:
-        """Generate HTML for a single source section.
+        self,
+        source_name: str,
+        articles: List["Article"],
+        source_url: Optional[str],
+        out: List[str],
+    ) -> None:
+        """Append HTML for a single source section.
 
         Args:
             source_name: Name of the source
             articles: List of articles from this source
-            source_url: URL of the source (optional, for clickable headers)
-
-        Returns:
-            HTML content for source section
+            source_url: URL of the source (None for a plain-text header)
+            out: Output buffer the HTML fragments are appended to
         """
-        # Escape source name for HTML
-        escaped_source_name = html.escape(source_name)
+        out.append(_SOURCE_SECTION_OPEN)
 
-        # Generate source header with optional link
+        # Source header with optional link
         if source_url:
-            source_header = f'<a href="{html.escape(source_url)}" target="_blank">{escaped_source_name}</a>'
+            out.extend(
+                (
+                    _LINK_OPEN,
+                    _attr(source_url),
+                    _LINK_TARGET,
+                    _esc(source_name),
+                    _LINK_CLOSE,
+                )
+            )
         else:
-            source_header = escaped_source_name
+            out.append(_esc(source_name))
 
-        # Generate articles HTML
-        articles_html = []
+        out.append(_SOURCE_SECTION_BODY)
         for article in articles:
-            articles_html.append(self._generate_article(article))
-
-        return f"""<div class="source-section">
-            <h2 class="source-header">{source_header}</h2>
-            {"".join(articles_html)}
-        </div>"""
+            self._generate_article(article, out)
+        out.append(_SOURCE_SECTION_CLOSE)
 
-    def _generate_article(self, article: Dict[str, Any]) -> str:
-        """Generate HTML for a single article.
+    def _generate_article(self, article: "Article", out: List[str]) -> None:
+        """Append HTML for a single article.
 
         Args:
             article: Article data dictionary
-
-        Returns:
-            HTML content for article
+            out: Output buffer the HTML fragments are appended to
         """
-        # Extract and escape article data, handling None values
-        title = html.escape(str(article.get("title") or "No Title"))
-        link = html.escape(str(article.get("link") or ""))
-        description = str(article.get("description") or "")
-        pub_date = article.get("pubDate") or ""
+        # Processor output always carries every field; partial dicts fall back to get
+        try:
+            title, link, description, pub_date = _article_fields(article)
+        except KeyError:
+            title = article.get("title")
+            link = article.get("link")
+            description = article.get("description")
+            pub_date = article.get("pubDate")
+
+        # Escape article data, handling None and empty values
+        title = _esc(title or "No Title")
+        link = _attr(link) if link else ""
+        description = description or ""
 
         # Apply description truncation if config is available
         if self.config and description:
@@ -325,42 +423,25 @@ class HTMLTemplate:
         else:
             formatted_date = format_readable_date(pub_date) or ""
 
-        # Generate title with optional link
+        out.append(_ARTICLE_OPEN)
+
+        # Date div if available
+        if formatted_date:
+            out.extend((_DATE_OPEN, formatted_date, _DIV_CLOSE))
+
+        # Title with optional link
+        out.append(_ARTICLE_TITLE_OPEN)
         if link:
-            title_html = f'<a href="{link}" target="_blank">{title}</a>'
+            out.extend((_LINK_OPEN, link, _LINK_TARGET, title, _LINK_CLOSE))
         else:
-            title_html = title
-
-        # Generate date div if available
-        date_html = (
-            f'<div class="article-date">{formatted_date}</div>'
-            if formatted_date
-            else ""
-        )
-
-        # Generate description if available
-        description_html = (
-            f'<div class="article-description">{description}</div>'
-            if description
-            else ""
-        )
-
-        return f"""<div class="article">
-            {date_html}
-            <h3 class="article-title">{title_html}</h3>
-            {description_html}
-        </div>"""
+            out.append(title)
+        out.append(_ARTICLE_TITLE_CLOSE)
 
-    def _generate_footer(self) -> str:
-        """Generate newsletter footer.
+        # Description if available
+        if description:
+            out.extend((_DESCRIPTION_OPEN, description, _DIV_CLOSE))
 
-        Returns:
-            HTML footer content
-        """
-        return """<div class="footer">
-            <p>You're receiving this newsletter because you subscribed via email.</p>
-            <p>Generated by <a href="#">Yomu Newsletter</a></p>
-        </div>"""
+        out.append(_ARTICLE_CLOSE)
 
     def _generate_empty_newsletter(self) -> str:
         """Generate HTML for empty newsletter.
@@ -368,37 +449,4 @@ class HTMLTemplate:
         Returns:
             HTML content for empty newsletter
         """
-        header = self._generate_header()
-        content = """
-        <div style="text-align: center; padding: 40px 20px; color: #666666;">
-            <p>No new articles this time. Check back later!</p>
-        </div>
-        """
-        footer = self._generate_footer()
-
-        return self._wrap_in_html_document(header + content + footer)
-
-    def _wrap_in_html_document(self, content: str) -> str:
-        """Wrap content in complete HTML document.
-
-        Args:
-            content: HTML content to wrap
-
-        Returns:
-            Complete HTML document
-        """
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="X-UA-Compatible" content="IE=edge">
-    <title>Your Newsletter</title>
-    {self.base_styles}
-</head>
-<body>
-    <div class="newsletter-container">
-        {content}
-    </div>
-</body>
-</html>"""
+        return _EMPTY_NEWSLETTER_HTML
@@ -1,14 +1,19 @@
 # ABOUTME: Newsletter service combining generation and email distribution
 # ABOUTME: Handles complete newsletter workflow from source processing to email delivery
 
-from typing import List
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timezone
 from yomu.content.processor import ContentProcessor
+from yomu.content.schema import Article
 from yomu.email.templates import HTMLTemplate
 from yomu.email.sender import EmailSender
 from yomu.config.config import Config
 from yomu.utils import get_logger
 
+# Upper bound on sources extracted concurrently
+MAX_SOURCE_WORKERS = 8
+
 
 class NewsletterService:
     """Newsletter service combining generation and email distribution."""
@@ -32,6 +37,10 @@ class NewsletterService:
         self.html_template = HTMLTemplate(config)
         self.logger = get_logger(__name__)
 
+    def flush_database(self):
+        """Checkpoint and close the database until the next newsletter cycle."""
+        self.content_processor.database.flush_and_close()
+
     def send_newsletter_to_user(self, user_email: str, sources: List[str]) -> bool:
         """Send newsletter to a specific user with provided sources.
 
@@ -43,13 +52,13 @@ class NewsletterService:
             True if newsletter was sent successfully, False otherwise
         """
         if not sources:
-            self.logger.info(f"No sources provided for user {user_email}")
+            self.logger.info("No sources provided for user %s", user_email)
             return False
 
         articles_by_source = self._collect_articles_from_sources(sources)
 
         if not articles_by_source:
-            self.logger.info(f"No articles found for user {user_email}")
+            self.logger.info("No articles found for user %s", user_email)
             return False
 
         try:
@@ -57,17 +66,17 @@ class NewsletterService:
                 articles_by_source
             )
         except Exception as e:
-            self.logger.error(f"Failed to generate newsletter for {user_email}: {e}")
+            self.logger.error("Failed to generate newsletter for %s: %s", user_email, e)
             return False
 
         try:
-            subject = f"Your Newsletter - {datetime.now().strftime('%B %d, %Y')}"
+            subject = f"Your Newsletter - {date.today().strftime('%B %d, %Y')}"
             self.email_sender.send_email(user_email, subject, newsletter_content)
-            self.logger.info(f"Newsletter sent successfully to {user_email}")
+            self.logger.info("Newsletter sent successfully to %s", user_email)
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to send newsletter to {user_email}: {e}")
+            self.logger.error("Failed to send newsletter to %s: %s", user_email, e)
             return False
 
     def _collect_articles_from_sources(self, sources: List[str]) -> dict:
@@ -83,27 +92,86 @@ class NewsletterService:
 
         if not sources:
             self.logger.info("No sources provided")
+            return articles_by_source
+
+        limit = self.config.max_articles_per_source
+        database = self.content_processor.database
+        known_sources = database.get_sources_by_urls(sources)
+        # Stamped before extraction so nothing published mid-cycle is skipped next time
+        run_started = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        # Extraction is network-bound, so sources are fetched concurrently
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_SOURCE_WORKERS, len(sources))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda source_url: self._fetch_source_articles(
+                            source_url, known_sources, limit
+                        ),
+                        sources,
+                    )
+                )
+        finally:
+            # The pool's threads have exited, so their extractors are no longer used
+            self.content_processor.close_extractors()
+
+        # Checkpoint every successfully processed source in one transaction
+        try:
+            database.bulk_upsert_runs(
+                (source_url, run_started)
+                for source_url, articles in zip(sources, results)
+                if articles is not None
+            )
+        except Exception as e:
+            self.logger.warning("Failed to record source runs: %s", e)
 
-        for source_url in sources:
-            try:
-                articles = self.content_processor.process_source(source_url)
-                if articles:
-                    original_count = len(articles)
-
-                    articles = articles[: self.config.max_articles_per_source]
-                    if original_count > self.config.max_articles_per_source:
-                        source_name = articles[0].get("source", source_url)
-                        self.logger.info(
-                            f"Limited {source_name}: {original_count} articles → {len(articles)} articles (max_articles_per_source={self.config.max_articles_per_source})"
-                        )
-
-                    source_name = articles[0].get("source", source_url)
-                    articles_by_source[source_name] = {
-                        "url": source_url,
-                        "articles": articles,
-                    }
-            except Exception as e:
-                self.logger.warning(f"Failed to process source {source_url}: {e}")
+        for source_url, articles in zip(sources, results):
+            if not articles:
                 continue
 
+            # The processor stops at the limit; only trim if it returned more anyway
+            if len(articles) > limit:
+                original_count = len(articles)
+                articles = articles[:limit]
+                source_name = articles[0].get("source", source_url)
+                self.logger.info(
+                    "Limited %s: %d articles -> %d articles (max_articles_per_source=%d)",
+                    source_name,
+                    original_count,
+                    len(articles),
+                    limit,
+                )
+
+            source_name = articles[0].get("source", source_url)
+            articles_by_source[source_name] = {
+                "url": source_url,
+                "articles": articles,
+            }
+
         return articles_by_source
+
+    def _fetch_source_articles(
+        self,
+        source_url: str,
+        known_sources: Dict[str, Dict[str, Any]],
+        limit: Optional[int] = None,
+    ) -> Optional[List[Article]]:
+        """Process a single source, logging and swallowing failures.
+
+        Args:
+            source_url: Source URL to process
+            known_sources: Prefetched source metadata keyed by URL
+            limit: Maximum number of articles to return (None for no limit)
+
+        Returns:
+            List of articles, or None if processing failed
+        """
+        try:
+            return self.content_processor.process_source(
+                source_url, known_sources, record_run=False, limit=limit
+            )
+        except Exception as e:
+            self.logger.warning("Failed to process source %s: %s", source_url, e)
+            return None
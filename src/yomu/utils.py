@@ -2,8 +2,10 @@
 # ABOUTME: Contains logging, exceptions, date parsing, and text processing utilities
 
 import logging
+import re
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 
@@ -61,11 +63,64 @@ COMMON_DATE_FORMATS = [
 ]
 
 
+# Formats that can match strings which don't start like an ISO 8601 date
+RFC822_DATE_FORMATS = COMMON_DATE_FORMATS[:2]
+
+
+@lru_cache(maxsize=1024)
+def _strptime(date_str: str, fmt: str) -> datetime:
+    """Memoized datetime.strptime for dates repeated across feeds and runs."""
+    return datetime.strptime(date_str, fmt)
+
+
+def _looks_like_iso(date_str: str) -> bool:
+    """Cheap check for a leading YYYY- date so ISO input skips RFC 822 attempts."""
+    return len(date_str) >= 10 and date_str[0].isdigit() and date_str[4] == "-"
+
+
+def _parse_iso(date_str: str) -> Optional[datetime]:
+    """Parse ISO 8601 text with the C fromisoformat parser.
+
+    Since Python 3.11 this accepts a trailing Z (as UTC), basic-format offsets
+    and fractional seconds, so no rewriting of the input is needed.
+
+    Args:
+            date_str: Cleaned date string
+
+    Returns:
+            Parsed datetime object, or None if parsing fails
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+_NONBLANK_RE = re.compile(r"\S")
+
+
+def _clean_date_string(date_str: Optional[str]) -> Optional[str]:
+    """Trim a date string, only copying it when it has surrounding whitespace.
+
+    Args:
+            date_str: Raw date string from a feed (can be None)
+
+    Returns:
+            Trimmed date string, or None if it is missing or blank
+    """
+    if not date_str or _NONBLANK_RE.search(date_str) is None:
+        return None
+    if date_str[0].isspace() or date_str[-1].isspace():
+        return date_str.strip()
+    return date_str
+
+
 def _parse_date_string(date_str: str) -> Optional[datetime]:
     """Parse date string using common formats.
 
     Helper function that extracts common parsing logic for date functions.
-    Attempts standard formats then falls back to ISO parsing.
+    ISO-looking input goes straight to fromisoformat; everything else only
+    tries the RFC 822 formats before the ISO fallback.
 
     Args:
             date_str: Cleaned date string (non-empty, stripped whitespace)
@@ -73,18 +128,26 @@ def _parse_date_string(date_str: str) -> Optional[datetime]:
     Returns:
             Parsed datetime object, or None if parsing fails
     """
-    for fmt in COMMON_DATE_FORMATS:
+    looks_iso = _looks_like_iso(date_str)
+    if looks_iso:
+        parsed = _parse_iso(date_str)
+        if parsed is not None:
+            return parsed
+
+    for fmt in COMMON_DATE_FORMATS if looks_iso else RFC822_DATE_FORMATS:
         try:
-            return datetime.strptime(date_str, fmt)
+            return _strptime(date_str, fmt)
         except ValueError:
             continue
 
-    try:
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-    except ValueError:
-        return None
+    return None if looks_iso else _parse_iso(date_str)
+
 
+# Feed dates repeat across sources, retries and runs, so parsed results are memoized
+DATE_CACHE_SIZE = 4096
 
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_iso_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
     """Parse ISO format timestamp (from database storage).
 
@@ -106,6 +169,7 @@ def parse_iso_timestamp(timestamp_str: Optional[str]) -> Optional[datetime]:
         return None
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse publication date from various formats.
 
@@ -118,13 +182,14 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
     Returns:
             Parsed datetime object, or None if parsing fails
     """
-    if date_str is None or not date_str or not date_str.strip():
+    date_str = _clean_date_string(date_str)
+    if date_str is None:
         return None
 
-    date_str = date_str.strip()
     return _parse_date_string(date_str)
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def format_readable_date(date_str: Optional[str]) -> Optional[str]:
     """Format date for newsletter display in human-readable format.
 
@@ -137,10 +202,10 @@ def format_readable_date(date_str: Optional[str]) -> Optional[str]:
     Returns:
             Formatted date string, or None if parsing fails
     """
-    if date_str is None or not date_str or not date_str.strip():
+    date_str = _clean_date_string(date_str)
+    if date_str is None:
         return None
 
-    date_str = date_str.strip()
     parsed_date = _parse_date_string(date_str)
     if parsed_date is None:
         return None
@@ -167,6 +232,9 @@ def normalize_datetime_to_utc_naive(dt: datetime) -> datetime:
         return dt
 
 
+_ELLIPSIS = "..."
+
+
 def truncate_description(text: str, max_length: int) -> str:
     """Truncate description text to specified length with smart word boundary handling.
 
@@ -186,20 +254,13 @@ def truncate_description(text: str, max_length: int) -> str:
     if len(text) <= max_length:
         return text
 
-    ellipsis = "..."
     if max_length <= 3:
-        return ellipsis[:max_length] if max_length > 0 else ""
-
-    available_length = max_length - len(ellipsis)
-
-    truncated = text[:available_length]
-
-    last_space = truncated.rfind(" ")
+        return _ELLIPSIS[:max_length]
 
-    if last_space > 0:
-        truncated = truncated[:last_space]
+    head = text[: max_length - len(_ELLIPSIS)]
 
-    if len(truncated) == 0:
-        truncated = text[:available_length]
+    # Cut back to the last word boundary unless the only space is at the start
+    before, space, _ = head.rpartition(" ")
+    truncated = before if space and before else head
 
-    return truncated + ellipsis
+    return truncated + _ELLIPSIS
@@ -3,7 +3,8 @@
 
 import pytest
 import os
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 
 def pytest_configure(config):
@@ -11,6 +12,20 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "unit: mark test as unit test")
     config.addinivalue_line("markers", "integration: mark test as integration test")
 
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_working_directory(tmp_path_factory):
+    """Run the session from a private temp directory.
+
+    Code under test that falls back to relative paths such as yomu.db writes
+    there instead of the checkout, so parallel workers never share a file.
+    """
+    previous = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("cwd"))
+    yield
+    os.chdir(previous)
+
+
 @pytest.fixture
 def mock_env_vars():
     """Fixture providing mock environment variables for testing."""
@@ -26,3 +41,80 @@ def config_env(mock_env_vars):
     """Fixture that patches environment variables for config testing."""
     with patch.dict(os.environ, mock_env_vars, clear=True):
         yield mock_env_vars
+
+
+@pytest.fixture(scope="session")
+def make_config():
+    """Factory for read-only config stubs with valid defaults.
+
+    A SimpleNamespace is far cheaper than a Mock and raises on unknown
+    attributes instead of silently returning child mocks.
+    """
+
+    def factory(**overrides):
+        values = {
+            "openrouter_api_key": "test-key",
+            "cookie_file_path": None,
+            "sender_email": "test@gmail.com",
+            "sender_password": "password",
+            "recipient_email": "test@example.com",
+            "smtp_server": "smtp.gmail.com",
+            "smtp_port": 587,
+            "sources": ["https://example.com"],
+            "frequencies": ["0 8 * * *"],
+            "max_articles_per_source": 3,
+            "max_description_length": 200,
+        }
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    return factory
+
+
+@pytest.fixture
+def memory_database():
+    """In-memory SQLite Database with tables created, closed after the test."""
+    from yomu.database.database import Database
+
+    database = Database(":memory:")
+    database.create_tables()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def processor_factory(make_config, memory_database):
+    """Factory fixture building a ContentProcessor over an in-memory database.
+
+    The returned callable accepts the feed the extractor should return, the
+    articles the feed converts to, and any extra ContentProcessor keyword
+    arguments. Seed source runs through the memory_database fixture.
+    """
+    from yomu.content.processor import ContentProcessor
+
+    def factory(extract_return=None, convert_return=None, **processor_kwargs):
+        # Fresh extractor per processor so stubbed results never leak between tests
+        extractor = Mock()
+        if extract_return is not None:
+            extractor.extract.return_value = extract_return
+        processor = ContentProcessor(
+            make_config(), memory_database, extractor=extractor, **processor_kwargs
+        )
+        if convert_return is not None:
+            processor._content_feed_to_articles = Mock(return_value=convert_return)
+        return processor
+
+    return factory
+
+
+@pytest.fixture
+def load_config_text(tmp_path):
+    """Loader writing YAML text to a temp config file and loading it as a Config."""
+    from yomu.config.config import Config
+
+    def load(content: str):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(content)
+        return Config.load_from_file(str(config_file))
+
+    return load
@@ -0,0 +1,63 @@
+# ABOUTME: Shared fixtures for Yomu integration tests
+# ABOUTME: Builds stubbed processors on processor_factory and ContentFeed test data
+
+import pytest
+from yomu.content.schema import ContentFeed, ContentChannel, ContentItem
+
+# Positional order of item specs passed to feed_factory
+_ITEM_FIELDS = ("title", "link", "description", "pubDate")
+
+
+@pytest.fixture
+def processor(processor_factory):
+    """ContentProcessor over the in-memory database with a mock extractor."""
+    return processor_factory()
+
+
+@pytest.fixture
+def stubbed_processor(processor_factory):
+    """Processor whose extraction and feed conversion are both mocks.
+
+    Returns a (processor, extract, convert) tuple; tests only need to set the
+    mocks' return values.
+    """
+    processor = processor_factory(convert_return=[])
+    return (
+        processor,
+        processor.hiku_extractor.extract,
+        processor._content_feed_to_articles,
+    )
+
+
+def feed_to_dicts(feed):
+    """Project a ContentFeed onto the article dicts the processor converts it to."""
+    source = feed.channel.title
+    return [
+        {
+            "title": item.title,
+            "link": item.link,
+            "description": item.description,
+            "pubDate": item.pubDate,
+            "source": source,
+        }
+        for item in feed.items
+    ]
+
+
+@pytest.fixture(scope="session")
+def feed_factory():
+    """Factory building a ContentFeed and the article dicts it converts to.
+
+    The returned callable takes a channel title and item specs of
+    (title, link[, description[, pubDate]]) and returns (feed, articles),
+    with the articles derived from the feed by feed_to_dicts.
+    """
+
+    def build(channel_title, item_specs):
+        # Validating constructors run in pydantic-core and are faster than the
+        # pure-Python model_construct, so there is nothing to gain by skipping them
+        items = [ContentItem(**dict(zip(_ITEM_FIELDS, spec))) for spec in item_specs]
+        feed = ContentFeed(channel=ContentChannel(title=channel_title), items=items)
+        return feed, feed_to_dicts(feed)
+
+    return build
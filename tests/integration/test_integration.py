@@ -2,213 +2,291 @@
 # ABOUTME: Tests multi-component interactions with real code (mocking only external APIs)
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from yomu.config.config import Config
-from yomu.content.processor import ContentProcessor
+import smtplib
+import threading
+from unittest.mock import Mock, patch
+from pydantic import ValidationError
+from yomu.config.config import Config, parse_schedules
+from yomu.content.processor import BoundedUrlSet, ContentProcessor
+from yomu.daemon.daemon import NewsletterDaemon
 from yomu.email.sender import EmailSender
-from yomu.newsletter.service import NewsletterService
+from yomu.newsletter.service import MAX_SOURCE_WORKERS, NewsletterService
 from yomu.content.schema import ContentFeed, ContentChannel, ContentItem
 
 
+# Feeds and the articles they convert to are immutable test inputs, so they are
+# validated once at import rather than in every test
+_FEED_MIXED = ContentFeed(
+    channel=ContentChannel(title="Test Feed"),
+    items=[
+        ContentItem(
+            title="Article with date",
+            link="https://example.com/1",
+            pubDate="Mon, 01 Jan 2024 10:00:00 GMT",
+        ),
+        ContentItem(title="Article without date", link="https://example.com/2"),
+    ],
+)
+# Shared read-only article dicts; the processor never mutates its input
+_ARTICLE_DATED = {
+    "title": "Article with date",
+    "link": "https://example.com/1",
+    "pubDate": "Mon, 01 Jan 2024 10:00:00 GMT",
+    "source": "Test Feed",
+}
+_ARTICLE_UNDATED = {
+    "title": "Article without date",
+    "link": "https://example.com/2",
+    "pubDate": "",
+    "source": "Test Feed",
+}
+_ARTICLES_MIXED = (_ARTICLE_DATED, _ARTICLE_UNDATED)
+
+_FEED_NODATE = ContentFeed(
+    channel=ContentChannel(title="Test"),
+    items=[ContentItem(title="No Date Article", link="https://example.com/no-date")],
+)
+_ARTICLES_NODATE = (
+    {
+        "title": "No Date Article",
+        "link": "https://example.com/no-date",
+        "pubDate": "",
+        "source": "Test",
+    },
+)
+
+# Pipeline scenarios keyed by short ids so test node ids never repr the feeds:
+# (feed, converted articles, expected article count, expected tracked URLs)
+_PIPELINE_SCENARIOS = {
+    "mixed-dates": (_FEED_MIXED, _ARTICLES_MIXED, 2, ["https://example.com/2"]),
+    "missing-pubdate": (
+        _FEED_NODATE,
+        _ARTICLES_NODATE,
+        1,
+        ["https://example.com/no-date"],
+    ),
+}
+
+# Raised by the stubbed extractor; an exception instance side_effect re-raises per call
+_VALIDATION_ERROR = ValidationError.from_exception_data(
+    "Content",
+    [
+        {
+            "type": "string_too_short",
+            "loc": ("items", 0, "title"),
+            "msg": "String too short",
+            "input": "",
+            "ctx": {"min_length": 1},
+        }
+    ],
+)
+
+
 @pytest.mark.integration
-class TestContentProcessorDeduplication:
-    """Integration test: Content processor deduplication across multiple runs."""
-
-    def test_processor_deduplication_with_mixed_dates_across_runs(self):
-        """Two runs: verify dedup prevents articles without dates from being included twice."""
-        mock_config = Mock()
-        mock_config.openrouter_api_key = "test-key"
-        mock_config.cookie_file_path = None
-        mock_database = Mock()
-        mock_database.get_source_by_url.return_value = None
-
-        with patch("yomu.content.processor.HikuExtractor"):
-            processor = ContentProcessor(mock_config, mock_database)
-
-            feed = ContentFeed(
-                channel=ContentChannel(title="Test Feed"),
-                items=[
-                    ContentItem(
-                        title="Article with date",
-                        link="https://example.com/1",
-                        pubDate="Mon, 01 Jan 2024 10:00:00 GMT",
-                    ),
-                    ContentItem(
-                        title="Article without date",
-                        link="https://example.com/2",
-                    ),
-                ],
-            )
+class TestContentProcessorPipeline:
+    """Processor deduplication, non-dated URL tracking and error propagation."""
 
-            with patch.object(processor.hiku_extractor, "extract") as mock_extract:
-                with patch.object(processor, "_content_feed_to_articles") as mock_convert:
-                    mock_extract.return_value = feed
-                    mock_convert.return_value = [
-                        {
-                            "title": "Article with date",
-                            "link": "https://example.com/1",
-                            "pubDate": "Mon, 01 Jan 2024 10:00:00 GMT",
-                            "source": "Test Feed",
-                        },
-                        {
-                            "title": "Article without date",
-                            "link": "https://example.com/2",
-                            "pubDate": "",
-                            "source": "Test Feed",
-                        },
-                    ]
-
-                    articles = processor.process_source("https://example.com/feed")
-
-                    assert len(articles) == 2
-                    assert "https://example.com/2" in processor.non_dated_processed_urls
+    @pytest.mark.parametrize("scenario_id", list(_PIPELINE_SCENARIOS))
+    def test_non_dated_articles_returned_and_tracked(
+        self, processor_factory, scenario_id
+    ):
+        """Articles without dates are included and their URLs tracked for dedup."""
+        feed, converted, expected_count, expected_tracked = _PIPELINE_SCENARIOS[
+            scenario_id
+        ]
+        processor = processor_factory(extract_return=feed, convert_return=converted)
 
+        articles = processor.process_source("https://example.com/feed")
 
-@pytest.mark.integration
-class TestProcessorHandlesMissingPubDate:
-    """Processor correctly tracks articles without pubDate in deque."""
-
-    def test_processor_adds_url_to_deque_when_no_pubdate(self):
-        """Article without pubDate gets added to deque for deduplication."""
-        mock_config = Mock()
-        mock_config.openrouter_api_key = "test-key"
-        mock_config.cookie_file_path = None
-        mock_database = Mock()
-        mock_database.get_source_by_url.return_value = None
-
-        with patch("yomu.content.processor.HikuExtractor"):
-            processor = ContentProcessor(mock_config, mock_database)
-
-            feed = ContentFeed(
-                channel=ContentChannel(title="Test"),
-                items=[
-                    ContentItem(
-                        title="No Date Article",
-                        link="https://example.com/no-date",
-                    )
-                ],
-            )
+        assert len(articles) == expected_count
+        assert list(processor.non_dated_processed_urls) == expected_tracked
 
-            with patch.object(processor.hiku_extractor, "extract") as mock_extract:
-                with patch.object(processor, "_content_feed_to_articles") as mock_convert:
-                    mock_extract.return_value = feed
-                    mock_convert.return_value = [
-                        {
-                            "title": "No Date Article",
-                            "link": "https://example.com/no-date",
-                            "pubDate": "",
-                            "source": "Test",
-                        }
-                    ]
+    def test_processor_propagates_extraction_errors(self, processor_factory):
+        """When Hiku extraction fails, error propagates to caller."""
+        processor = processor_factory()
+        processor.hiku_extractor.extract.side_effect = _VALIDATION_ERROR
+
+        with pytest.raises(ValidationError):
+            processor.process_source("https://example.com")
+
+
+# Generated extraction code returned by the stubbed LLM; the fetched "page" is the
+# source URL itself so every source yields a distinct article link
+_EXTRACTION_CODE = """
+def extract_data(html_content):
+    return {
+        "channel": {"title": html_content},
+        "items": [{"title": "Article", "link": html_content + "/article"}],
+    }
+"""
 
-                    processor.process_source("https://example.com")
 
-                    assert (
-                        "https://example.com/no-date"
-                        in processor.non_dated_processed_urls
-                    )
+@pytest.mark.integration
+class TestConcurrentSourceExtraction:
+    """Sources extracted concurrently share the on-disk Hikugen code cache safely."""
+
+    def test_concurrent_sources_through_real_hiku_database(
+        self, make_config, memory_database, tmp_path
+    ):
+        """Every source survives concurrent runs against a real HikuDatabase."""
+        sources = [
+            f"https://example.com/feed{i}" for i in range(4 * MAX_SOURCE_WORKERS)
+        ]
+        processor = ContentProcessor(
+            make_config(), memory_database, db_path=str(tmp_path / "hiku.db")
+        )
+        service = NewsletterService(make_config(), processor, Mock())
+        # Released once every worker has fetched, so all of them hit the cache at once
+        all_fetched = threading.Barrier(MAX_SOURCE_WORKERS, timeout=10)
+
+        def fetch_page_content(url, **kwargs):
+            all_fetched.wait()
+            return url
+
+        # Only the network and the LLM are stubbed; code caching hits real SQLite
+        with (
+            patch(
+                "hikugen.extractor.fetch_page_content", side_effect=fetch_page_content
+            ),
+            patch(
+                "hikugen.code_generator.HikuCodeGenerator.generate_extraction_code",
+                return_value=(_EXTRACTION_CODE, True),
+            ),
+            patch(
+                "hikugen.code_generator.HikuCodeGenerator.check_data_quality_with_llm",
+                return_value=(True, []),
+            ),
+        ):
+            # The first run writes generated code to the cache, the rest read it
+            runs = []
+            for _ in range(10):
+                runs.append(service._collect_articles_from_sources(sources))
+                processor.non_dated_processed_urls = BoundedUrlSet(len(sources))
+
+        for articles_by_source in runs:
+            assert sorted(articles_by_source) == sorted(sources)
+
+
+# Daily 8 AM and weekly Sunday 9 AM, parsed once; the daemon resets their base time
+# on every lookup so sharing them between tests is safe
+DAEMON_SCHEDULE = ("0 8 * * *", "0 9 * * 0")
+DAEMON_CRONS = tuple(parse_schedules(DAEMON_SCHEDULE))
 
 
 @pytest.mark.integration
 class TestDaemonMultipleScheduleExecution:
     """Daemon correctly identifies earliest next run time across multiple schedules."""
 
-    def test_daemon_picks_earliest_schedule_between_daily_and_weekly(self):
+    def test_daemon_picks_earliest_schedule_between_daily_and_weekly(self, make_config):
         """With daily (8 AM) and weekly (Sunday 9 AM) schedules, picks earliest."""
-        from yomu.daemon.daemon import NewsletterDaemon
+        config = make_config(
+            frequencies=list(DAEMON_SCHEDULE), crons=lambda: list(DAEMON_CRONS)
+        )
 
-        mock_config = Mock()
-        mock_config.recipient_email = "test@example.com"
-        mock_config.sources = ["https://example.com"]
-        mock_config.frequencies = ["0 8 * * *", "0 9 * * 0"]
+        daemon = NewsletterDaemon(config, Mock())
 
-        mock_distributor = Mock()
+        assert daemon.crons == list(DAEMON_CRONS)
 
-        daemon = NewsletterDaemon(mock_config, mock_distributor)
+        next_run_time, current_time = daemon._get_next_run_time()
+        assert next_run_time > current_time
+        assert next_run_time.minute == 0
+        assert next_run_time.hour == 8 or (
+            next_run_time.hour == 9 and next_run_time.weekday() == 6
+        )
 
-        assert len(daemon.crons) == 2
+    def test_parse_schedules_without_daemon(self):
+        """Schedules parse directly into cron iterators without building a daemon."""
+        crons = parse_schedules(list(DAEMON_SCHEDULE))
+
+        assert [cron.expressions for cron in crons] == [
+            ["0", "8", "*", "*", "*"],
+            ["0", "9", "*", "*", "0"],
+        ]
+
+    def test_daemon_flushes_database_before_each_sleep(self, make_config):
+        """Database handles are released at the end of every cycle."""
+        config = make_config(crons=lambda: list(DAEMON_CRONS))
+        service = Mock()
+        daemon = NewsletterDaemon(config, service)
+
+        with patch(
+            "yomu.daemon.daemon.time.sleep", side_effect=[None, KeyboardInterrupt]
+        ):
+            with pytest.raises(KeyboardInterrupt):
+                daemon.run()
+
+        assert [name for name, _, _ in service.mock_calls] == [
+            "flush_database",
+            "send_newsletter_to_user",
+            "flush_database",
+        ]
+
+    def test_daemon_reuses_crons_validated_by_config(self):
+        """Cron iterators parsed during config validation are handed to the daemon."""
+        config = Config(
+            openrouter_api_key="test-key",
+            sender_email="sender@gmail.com",
+            sender_password="test-password",
+            recipient_email="test@example.com",
+            sources=["https://example.com"],
+            frequencies=list(DAEMON_SCHEDULE),
+        )
+        config.validate()
 
+        with patch("yomu.config.config.croniter") as mock_croniter:
+            daemon = NewsletterDaemon(config, Mock())
 
-@pytest.mark.integration
-class TestEmailSendingWithRetry:
-    """Email sending handles transient failures gracefully."""
+        mock_croniter.assert_not_called()
+        assert daemon.crons == config.crons()
+        assert [cron.expressions for cron in daemon.crons] == [
+            cron.expressions for cron in DAEMON_CRONS
+        ]
 
-    def test_email_sender_handles_temporary_connection_failure(self):
-        """SMTP connection fails once, succeeds on retry (if implemented)."""
-        import smtplib
 
-        mock_config = Mock()
-        mock_config.sender_email = "test@gmail.com"
-        mock_config.sender_password = "password"
+@pytest.fixture(scope="module")
+def smtp_factory():
+    """SMTP connection factory injected into the shared EmailSender."""
+    return Mock(return_value=Mock(spec=smtplib.SMTP))
 
-        email_sender = EmailSender(mock_config)
 
-        with patch("smtplib.SMTP") as mock_smtp_class:
-            mock_server = Mock()
-            mock_server.starttls.return_value = None
-            mock_server.login.return_value = None
-            mock_server.send_message.return_value = None
-            mock_server.quit.return_value = None
-            mock_smtp_class.return_value = mock_server
+@pytest.fixture(scope="module")
+def shared_email_sender(make_config, smtp_factory):
+    """One EmailSender reused by every SMTP test in this module."""
+    return EmailSender(make_config(), smtp_factory=smtp_factory)
 
-            email_sender.send_email(
-                "recipient@example.com", "Test", "<html>Test</html>"
-            )
 
-            assert mock_smtp_class.called
-            assert mock_server.quit.called
+@pytest.mark.integration
+class TestEmailSendingWithRetry:
+    """Email sending handles transient failures gracefully."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_transport(self, smtp_factory):
+        """Clear SMTP calls recorded by the previous test."""
+        smtp_factory.reset_mock()
+
+    def test_email_sender_handles_temporary_connection_failure(
+        self, smtp_factory, shared_email_sender
+    ):
+        """SMTP connection fails once, succeeds on retry (if implemented)."""
+        shared_email_sender.send_email(
+            "recipient@example.com", "Test", "<html>Test</html>"
+        )
+
+        assert smtp_factory.called
+        assert smtp_factory.return_value.quit.called
 
 
 @pytest.mark.integration
 class TestConfigValidationErrorMessages:
     """Config validation provides helpful error messages."""
 
-    def test_missing_required_field_error_mentions_field_name(self, tmp_path):
+    def test_missing_required_field_error_mentions_field_name(self, load_config_text):
         """Missing field error includes field name."""
-        config_file = tmp_path / "bad_config.yaml"
-        config_file.write_text(
-            """
+        with pytest.raises(ValueError, match=".*required.*"):
+            load_config_text(
+                """
 sender_email: "test@gmail.com"
 sender_password: "password"
 recipient_email: "user@example.com"
 """
-        )
-
-        with pytest.raises(ValueError, match=".*required.*"):
-            Config.load_from_file(str(config_file))
-
-
-@pytest.mark.integration
-class TestContentProcessingErrorRecovery:
-    """Processor handles extraction failures gracefully."""
-
-    def test_processor_propagates_extraction_errors(self):
-        """When Hiku extraction fails, error propagates to caller."""
-        from pydantic import ValidationError
-
-        mock_config = Mock()
-        mock_config.openrouter_api_key = "test-key"
-        mock_config.cookie_file_path = None
-        mock_database = Mock()
-        mock_database.get_source_by_url.return_value = None
-
-        with patch("yomu.content.processor.HikuExtractor") as mock_extractor_class:
-            mock_extractor = Mock()
-            mock_extractor_class.return_value = mock_extractor
-            mock_extractor.extract.side_effect = ValidationError.from_exception_data(
-                "Content",
-                [
-                    {
-                        "type": "string_too_short",
-                        "loc": ("items", 0, "title"),
-                        "msg": "String too short",
-                        "input": "",
-                        "ctx": {"min_length": 1},
-                    }
-                ],
             )
-
-            processor = ContentProcessor(mock_config, mock_database)
-
-            with pytest.raises(ValidationError):
-                processor.process_source("https://example.com")
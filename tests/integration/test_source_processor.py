@@ -2,1049 +2,729 @@
 # ABOUTME: Tests ContentProcessor class using Hiku for extraction
 
 import pytest
-from unittest.mock import Mock, patch
+import random
+import requests
+from unittest.mock import patch
 from datetime import datetime
-from collections import deque
-from yomu.content.processor import ContentProcessor
+from yomu.content.processor import BoundedUrlSet
 from yomu.content.schema import ContentFeed, ContentChannel, ContentItem
+from yomu import utils
+from yomu.utils import parse_date
+
+
+# Reference-model inputs: missing, unparseable, before and after _MODEL_LAST_RUN
+_MODEL_LAST_RUN = datetime(2024, 1, 1, 12, 0, 0)
+_MODEL_PUB_DATES = (
+    "",
+    "invalid",
+    "Mon, 01 Jan 2024 10:00:00 GMT",
+    "Mon, 01 Jan 2024 14:00:00 GMT",
+)
+
+
+def link_set(articles):
+    """Collect the links of processed articles for membership assertions."""
+    return {article["link"] for article in articles}
 
 
 @pytest.mark.integration
 class TestContentProcessor:
     """Test ContentProcessor class functionality."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration object."""
-        config = Mock()
-        config.openrouter_api_key = "test-key"
-        config.cookie_file_path = None
-        return config
-
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database operations."""
-        db = Mock()
-        db.get_source_by_url.return_value = None  # No existing source by default
-        return db
-
-    @pytest.fixture
-    def processor(self, mock_config, mock_database):
-        """Create ContentProcessor instance with mocks."""
-        return ContentProcessor(mock_config, mock_database)
-
-    def test_process_source_with_existing_rss_feed(self, processor, mock_database):
+    def test_process_source_with_existing_rss_feed(
+        self, stubbed_processor, feed_factory
+    ):
         """Test processing a source that already has RSS."""
+        processor, mock_extract, mock_convert = stubbed_processor
+
         source_url = "https://example.com/feed.xml"
 
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed", link=source_url, description="Test Feed"
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed",
+            [
+                (
+                    "Test Article 1",
+                    "https://example.com/article1",
+                    "First test article",
+                    "Sun, 01 Jan 2023 10:00:00 GMT",
                 ),
-                items=[
-                    ContentItem(
-                        title="Test Article 1",
-                        link="https://example.com/article1",
-                        description="First test article",
-                        pubDate="Sun, 01 Jan 2023 10:00:00 GMT",
-                    )
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Test Article 1",
-                    "link": "https://example.com/article1",
-                    "description": "First test article",
-                    "pubDate": "Sun, 01 Jan 2023 10:00:00 GMT",
-                    "source": "Test Feed",
-                }
-            ]
-
-            articles = processor.process_source(source_url)
-
-            assert len(articles) == 1
-            assert articles[0]["title"] == "Test Article 1"
-            assert articles[0]["link"] == "https://example.com/article1"
-            mock_extract.assert_called_once()
-            call_kwargs = mock_extract.call_args[1]
-            assert call_kwargs["url"] == source_url
-            assert call_kwargs["schema"] == ContentFeed
-            mock_convert.assert_called_once_with(mock_rss_feed, source_url)
-
-    def test_process_source_with_html_page_first_time(self, processor, mock_database):
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        articles = processor.process_source(source_url)
+
+        assert len(articles) == 1
+        assert articles[0]["title"] == "Test Article 1"
+        assert articles[0]["link"] == "https://example.com/article1"
+        mock_extract.assert_called_once()
+        call_kwargs = mock_extract.call_args[1]
+        assert call_kwargs["url"] == source_url
+        assert call_kwargs["schema"] == ContentFeed
+        mock_convert.assert_called_once_with(mock_rss_feed, source_url)
+
+    def test_process_source_with_html_page_first_time(
+        self, stubbed_processor, memory_database, feed_factory
+    ):
         """Test processing a non-RSS page using Hiku."""
+        processor, mock_extract, mock_convert = stubbed_processor
+
         source_url = "https://example.com/blog"
 
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test", link="https://example.com", description="Test"
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test",
+            [
+                (
+                    "Test Article",
+                    "https://example.com/test",
+                    "Test",
+                    "Mon, 01 Jan 2024 10:00:00 GMT",
                 ),
-                items=[
-                    ContentItem(
-                        title="Test Article",
-                        link="https://example.com/test",
-                        description="Test",
-                        pubDate="Mon, 01 Jan 2024 10:00:00 GMT",
-                    )
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Test Article",
-                    "link": "https://example.com/test",
-                    "description": "Test",
-                    "pubDate": "Mon, 01 Jan 2024 10:00:00 GMT",
-                    "source": "Test",
-                }
-            ]
-
-            articles = processor.process_source(source_url)
-
-            mock_extract.assert_called_once()
-            call_kwargs = mock_extract.call_args[1]
-            assert call_kwargs["url"] == source_url
-            assert call_kwargs["schema"] == ContentFeed
-            mock_convert.assert_called_once_with(mock_rss_feed, source_url)
-            mock_database.add_source.assert_called_once_with(source_url)
-            assert len(articles) == 1
-            assert articles[0]["title"] == "Test Article"
-
-    def test_article_filtering_by_timestamp(self, processor, mock_database):
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        articles = processor.process_source(source_url)
+
+        mock_extract.assert_called_once()
+        call_kwargs = mock_extract.call_args[1]
+        assert call_kwargs["url"] == source_url
+        assert call_kwargs["schema"] == ContentFeed
+        mock_convert.assert_called_once_with(mock_rss_feed, source_url)
+        stored = memory_database.get_source_by_url(source_url)
+        assert stored["last_successful_run"] is not None
+        assert len(articles) == 1
+        assert articles[0]["title"] == "Test Article"
+
+    def test_article_filtering_by_timestamp(
+        self, stubbed_processor, memory_database, feed_factory
+    ):
         """Test that articles are filtered by last successful run timestamp."""
+        processor, mock_extract, mock_convert = stubbed_processor
+
         source_url = "https://example.com/feed.xml"
         last_run = datetime(2023, 1, 1, 12, 0, 0)
 
-        mock_source = {
-            "url": source_url,
-            "extraction_code": None,
-            "last_successful_run": last_run.isoformat(),
-        }
-
-        mock_database.get_source_by_url.return_value = mock_source
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed", link=source_url, description="Test Feed"
+        memory_database.upsert_source_run(source_url, last_run)
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed",
+            [
+                (
+                    "Old Article",
+                    "https://example.com/old",
+                    "Before last run",
+                    "Sun, 01 Jan 2023 10:00:00 GMT",
                 ),
-                items=[
-                    ContentItem(
-                        title="Old Article",
-                        link="https://example.com/old",
-                        description="Before last run",
-                        pubDate="Sun, 01 Jan 2023 10:00:00 GMT",
-                    ),
-                    ContentItem(
-                        title="New Article",
-                        link="https://example.com/new",
-                        description="After last run",
-                        pubDate="Sun, 01 Jan 2023 14:00:00 GMT",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Old Article",
-                    "link": "https://example.com/old",
-                    "description": "Before last run",
-                    "pubDate": "Sun, 01 Jan 2023 10:00:00 GMT",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "New Article",
-                    "link": "https://example.com/new",
-                    "description": "After last run",
-                    "pubDate": "Sun, 01 Jan 2023 14:00:00 GMT",
-                    "source": "Test Feed",
-                },
-            ]
-
-            articles = processor.process_source(source_url)
-
-            assert len(articles) == 1
-            assert articles[0]["title"] == "New Article"
-
-    def test_network_error_handling(self, processor, mock_database):
+                (
+                    "New Article",
+                    "https://example.com/new",
+                    "After last run",
+                    "Sun, 01 Jan 2023 14:00:00 GMT",
+                ),
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        articles = processor.process_source(source_url)
+
+        assert len(articles) == 1
+        assert articles[0]["title"] == "New Article"
+
+    def test_pubdate_parsed_once_per_distinct_string(
+        self, stubbed_processor, memory_database, feed_factory
+    ):
+        """Test that repeated pubDate strings across runs are parsed only once."""
+        processor, mock_extract, mock_convert = stubbed_processor
+        memory_database.upsert_source_run(
+            "https://example.com/feed", datetime(2023, 1, 1, 12, 0, 0)
+        )
+        pub_dates = [
+            "Mon, 02 Jan 2023 10:00:00 GMT",
+            "Tue, 03 Jan 2023 10:00:00 GMT",
+            "Mon, 02 Jan 2023 10:00:00 GMT",
+        ]
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed",
+            [
+                (f"Article {i}", f"https://example.com/{i}", "", pub_date)
+                for i, pub_date in enumerate(pub_dates)
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        parse_date.cache_clear()
+        with patch(
+            "yomu.utils._parse_date_string", wraps=utils._parse_date_string
+        ) as mock_parse:
+            processor.process_source("https://example.com/feed", record_run=False)
+            processor.process_source("https://example.com/feed", record_run=False)
+
+        assert mock_parse.call_count == len(set(pub_dates))
+
+    def test_process_source_stops_filtering_at_limit(self, processor):
+        """Test that filtering stops once the article limit is reached."""
+        feed = ContentFeed(
+            channel=ContentChannel(title="Test Feed"),
+            items=[
+                ContentItem(title=f"Article {i}", link=f"https://example.com/{i}")
+                for i in range(5)
+            ],
+        )
+
+        processor.hiku_extractor.extract.return_value = feed
+        articles = processor.process_source("https://example.com/feed", limit=2)
+
+        assert [article["title"] for article in articles] == ["Article 0", "Article 1"]
+        # Unexamined non-dated articles stay eligible for a later run
+        assert list(processor.non_dated_processed_urls) == [
+            "https://example.com/0",
+            "https://example.com/1",
+        ]
+
+    def test_network_error_handling(self, processor, memory_database):
         """Test handling of network errors when fetching source."""
         source_url = "https://example.com/unreachable"
 
-        with patch.object(processor.hiku_extractor, "extract") as mock_extract:
-            import requests
-
-            mock_extract.side_effect = requests.exceptions.ConnectionError(
-                "Network error"
-            )
+        processor.hiku_extractor.extract.side_effect = (
+            requests.exceptions.ConnectionError("Network error")
+        )
 
-            with pytest.raises(Exception):
-                processor.process_source(source_url)
+        with pytest.raises(Exception):
+            processor.process_source(source_url)
 
-    def test_invalid_rss_handling(self, processor, mock_database):
+    def test_invalid_rss_handling(self, stubbed_processor, feed_factory):
         """Test handling of invalid RSS content with Hiku."""
+        processor, mock_extract, mock_convert = stubbed_processor
+
         source_url = "https://example.com/bad-rss"
 
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Generated",
-                    link="https://example.com",
-                    description="Generated",
+        mock_rss_feed, feed_articles = feed_factory(
+            "Generated",
+            [
+                (
+                    "Generated Article",
+                    "https://example.com/generated",
+                    "Generated",
+                    "Mon, 01 Jan 2024 10:00:00 GMT",
                 ),
-                items=[
-                    ContentItem(
-                        title="Generated Article",
-                        link="https://example.com/generated",
-                        description="Generated",
-                        pubDate="Mon, 01 Jan 2024 10:00:00 GMT",
-                    )
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Generated Article",
-                    "link": "https://example.com/generated",
-                    "description": "Generated",
-                    "pubDate": "Mon, 01 Jan 2024 10:00:00 GMT",
-                    "source": "Generated",
-                }
-            ]
-
-            articles = processor.process_source(source_url)
-
-            mock_extract.assert_called_once()
-            call_kwargs = mock_extract.call_args[1]
-            assert call_kwargs["url"] == source_url
-            assert call_kwargs["schema"] == ContentFeed
-            assert len(articles) == 1
-            assert articles[0]["title"] == "Generated Article"
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        articles = processor.process_source(source_url)
+
+        mock_extract.assert_called_once()
+        call_kwargs = mock_extract.call_args[1]
+        assert call_kwargs["url"] == source_url
+        assert call_kwargs["schema"] == ContentFeed
+        assert len(articles) == 1
+        assert articles[0]["title"] == "Generated Article"
 
 
 @pytest.mark.integration
 class TestContentProcessorDequeIntegration:
     """Test ContentProcessor deque integration for non-dated URL tracking."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration object."""
-        config = Mock()
-        config.openrouter_api_key = "test-key"
-        config.cookie_file_path = None
-        return config
-
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database operations."""
-        db = Mock()
-        db.get_source_by_url.return_value = None
-        return db
-
-    def test_processor_initializes_with_empty_deque(self, mock_config, mock_database):
+    def test_processor_initializes_with_empty_deque(self, processor_factory):
         """Test ContentProcessor initializes with empty non_dated_processed_urls deque."""
-        processor = ContentProcessor(mock_config, mock_database)
+        processor = processor_factory()
 
         assert hasattr(processor, "non_dated_processed_urls")
 
-        assert isinstance(processor.non_dated_processed_urls, deque)
+        assert isinstance(processor.non_dated_processed_urls, BoundedUrlSet)
 
         assert len(processor.non_dated_processed_urls) == 0
 
-    def test_processor_initializes_with_configurable_maxlen(
-        self, mock_config, mock_database
-    ):
+    def test_processor_initializes_with_configurable_maxlen(self, processor_factory):
         """Test ContentProcessor accepts configurable maxlen for deque."""
-        processor = ContentProcessor(mock_config, mock_database, max_fallback_urls=500)
+        processor = processor_factory(max_fallback_urls=500)
 
         assert processor.non_dated_processed_urls.maxlen == 500
 
-    def test_processor_uses_default_maxlen_when_none_provided(
-        self, mock_config, mock_database
-    ):
+    def test_processor_uses_default_maxlen_when_none_provided(self, processor_factory):
         """Test ContentProcessor uses default maxlen when none provided."""
-        processor = ContentProcessor(mock_config, mock_database)
+        processor = processor_factory()
 
         assert processor.non_dated_processed_urls.maxlen == 1000
 
-    def test_url_stored_when_rss_has_no_pubdate_element(
-        self, mock_config, mock_database
+    @pytest.mark.parametrize(
+        "pubdate,link,expected_in_deque",
+        [
+            pytest.param("", "https://example.com/no-date", True, id="no-pubdate"),
+            pytest.param(
+                "invalid-date-format",
+                "https://example.com/bad-date",
+                True,
+                id="unparseable-pubdate",
+            ),
+            pytest.param(
+                "Mon, 01 Jan 2024 12:00:00 GMT",
+                "https://example.com/good-date",
+                False,
+                id="valid-pubdate",
+            ),
+        ],
+    )
+    def test_url_storage_by_pubdate(
+        self, stubbed_processor, feed_factory, pubdate, link, expected_in_deque
     ):
-        """Test URL stored when RSS item has no pubDate element."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
-                ),
-                items=[
-                    ContentItem(
-                        title="Article Without Date",
-                        link="https://example.com/no-date",
-                        description="This article has no pubDate",
-                        pubDate="",
-                    )
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Article Without Date",
-                    "link": "https://example.com/no-date",
-                    "description": "This article has no pubDate",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                }
-            ]
-
-            processor.process_source("https://example.com/feed")
-
-            assert "https://example.com/no-date" in processor.non_dated_processed_urls
-            assert len(processor.non_dated_processed_urls) == 1
-
-    def test_url_stored_when_pubdate_content_unparseable(
-        self, mock_config, mock_database
-    ):
-        """Test URL stored when pubDate content cannot be parsed."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
-                ),
-                items=[
-                    ContentItem(
-                        title="Article With Bad Date",
-                        link="https://example.com/bad-date",
-                        description="This article has unparseable date",
-                        pubDate="invalid-date-format",
-                    )
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Article With Bad Date",
-                    "link": "https://example.com/bad-date",
-                    "description": "This article has unparseable date",
-                    "pubDate": "invalid-date-format",
-                    "source": "Test Feed",
-                }
-            ]
-
-            processor.process_source("https://example.com/feed")
-
-            assert "https://example.com/bad-date" in processor.non_dated_processed_urls
-            assert len(processor.non_dated_processed_urls) == 1
-
-    def test_url_not_stored_when_pubdate_parses_successfully(
-        self, mock_config, mock_database
-    ):
-        """Test URL NOT stored when pubDate parses successfully."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
-                ),
-                items=[
-                    ContentItem(
-                        title="Article With Good Date",
-                        link="https://example.com/good-date",
-                        description="This article has valid date",
-                        pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
-                    )
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Article With Good Date",
-                    "link": "https://example.com/good-date",
-                    "description": "This article has valid date",
-                    "pubDate": "Mon, 01 Jan 2024 12:00:00 GMT",
-                    "source": "Test Feed",
-                }
-            ]
-
-            processor.process_source("https://example.com/feed")
-
-            assert (
-                "https://example.com/good-date"
-                not in processor.non_dated_processed_urls
-            )
-            assert len(processor.non_dated_processed_urls) == 0
+        """Test URL stored only when pubDate is missing or cannot be parsed."""
+        processor, mock_extract, mock_convert = stubbed_processor
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed", [("Article", link, "Article description", pubdate)]
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        processor.process_source("https://example.com/feed")
+
+        assert (link in processor.non_dated_processed_urls) is expected_in_deque
+        assert len(processor.non_dated_processed_urls) == int(expected_in_deque)
 
     def test_correct_article_url_stored_from_link_element(
-        self, mock_config, mock_database
+        self, stubbed_processor, feed_factory
     ):
         """Test correct article URL is stored from link element."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
+        processor, mock_extract, mock_convert = stubbed_processor
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed",
+            [
+                (
+                    "First Article",
+                    "https://example.com/first",
+                    "First article without date",
                 ),
-                items=[
-                    ContentItem(
-                        title="First Article",
-                        link="https://example.com/first",
-                        description="First article without date",
-                        pubDate="",
-                    ),
-                    ContentItem(
-                        title="Second Article",
-                        link="https://example.com/second",
-                        description="Second article with date",
-                        pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
-                    ),
-                    ContentItem(
-                        title="Third Article",
-                        link="https://example.com/third",
-                        description="Third article without date",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "First Article",
-                    "link": "https://example.com/first",
-                    "description": "First article without date",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "Second Article",
-                    "link": "https://example.com/second",
-                    "description": "Second article with date",
-                    "pubDate": "Mon, 01 Jan 2024 12:00:00 GMT",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "Third Article",
-                    "link": "https://example.com/third",
-                    "description": "Third article without date",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-            ]
-
-            processor.process_source("https://example.com/feed")
-
-            assert "https://example.com/first" in processor.non_dated_processed_urls
-            assert "https://example.com/third" in processor.non_dated_processed_urls
-
-            assert (
-                "https://example.com/second" not in processor.non_dated_processed_urls
-            )
-
-            assert len(processor.non_dated_processed_urls) == 2
+                (
+                    "Second Article",
+                    "https://example.com/second",
+                    "Second article with date",
+                    "Mon, 01 Jan 2024 12:00:00 GMT",
+                ),
+                (
+                    "Third Article",
+                    "https://example.com/third",
+                    "Third article without date",
+                ),
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        processor.process_source("https://example.com/feed")
+
+        assert "https://example.com/first" in processor.non_dated_processed_urls
+        assert "https://example.com/third" in processor.non_dated_processed_urls
+
+        assert "https://example.com/second" not in processor.non_dated_processed_urls
+
+        assert len(processor.non_dated_processed_urls) == 2
 
 
 @pytest.mark.integration
 class TestContentProcessorDeduplication:
     """Test ContentProcessor deduplication filtering logic."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration object."""
-        config = Mock()
-        config.openrouter_api_key = "test-key"
-        config.cookie_file_path = None
-        return config
-
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database operations."""
-        db = Mock()
-        db.get_source_by_url.return_value = None
-        return db
-
-    def test_articles_filtered_when_url_exists_in_deque(
-        self, mock_config, mock_database
+    @pytest.mark.parametrize(
+        "remembered_url,expected_links",
+        [
+            pytest.param(
+                "https://example.com/already-processed",
+                ["https://example.com/new-article"],
+                id="url-in-deque",
+            ),
+            pytest.param(
+                "https://other.com/other-article",
+                [
+                    "https://example.com/already-processed",
+                    "https://example.com/new-article",
+                ],
+                id="url-not-in-deque",
+            ),
+        ],
+    )
+    def test_articles_filtered_by_remembered_urls(
+        self, stubbed_processor, feed_factory, remembered_url, expected_links
     ):
-        """Test articles filtered when their URL exists in deque."""
-        processor = ContentProcessor(mock_config, mock_database)
+        """Test articles are filtered only when their URL is already in the deque."""
+        processor, mock_extract, mock_convert = stubbed_processor
+
+        processor._remember_nondated(remembered_url)
 
-        processor.non_dated_processed_urls.append(
-            "https://example.com/already-processed"
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed",
+            [
+                ("Already Processed Article", "https://example.com/already-processed"),
+                ("New Article", "https://example.com/new-article"),
+            ],
         )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
 
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
-                ),
-                items=[
-                    ContentItem(
-                        title="Already Processed Article",
-                        link="https://example.com/already-processed",
-                        description="This article was already processed",
-                        pubDate="",
-                    ),
-                    ContentItem(
-                        title="New Article",
-                        link="https://example.com/new-article",
-                        description="This is a new article",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Already Processed Article",
-                    "link": "https://example.com/already-processed",
-                    "description": "This article was already processed",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "New Article",
-                    "link": "https://example.com/new-article",
-                    "description": "This is a new article",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-            ]
-
-            articles = processor.process_source("https://example.com/feed")
-
-            article_links = [article["link"] for article in articles]
-            assert "https://example.com/already-processed" not in article_links
-            assert "https://example.com/new-article" in article_links
-            assert len(articles) == 1
-
-    def test_articles_pass_when_url_not_in_deque(self, mock_config, mock_database):
-        """Test articles pass filtering when URL not in deque."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        processor.non_dated_processed_urls.append("https://other.com/other-article")
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
-                ),
-                items=[
-                    ContentItem(
-                        title="New Article 1",
-                        link="https://example.com/new1",
-                        description="First new article",
-                        pubDate="",
-                    ),
-                    ContentItem(
-                        title="New Article 2",
-                        link="https://example.com/new2",
-                        description="Second new article",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "New Article 1",
-                    "link": "https://example.com/new1",
-                    "description": "First new article",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "New Article 2",
-                    "link": "https://example.com/new2",
-                    "description": "Second new article",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-            ]
-
-            articles = processor.process_source("https://example.com/feed")
-
-            article_links = [article["link"] for article in articles]
-            assert "https://example.com/new1" in article_links
-            assert "https://example.com/new2" in article_links
-            assert len(articles) == 2
+        articles = processor.process_source("https://example.com/feed")
+
+        assert [article["link"] for article in articles] == expected_links
 
     def test_filtering_works_with_existing_timestamp_logic(
-        self, mock_config, mock_database
+        self, stubbed_processor, memory_database, feed_factory
     ):
         """Test URL filtering works correctly with existing timestamp logic."""
-        processor = ContentProcessor(mock_config, mock_database)
+        processor, mock_extract, mock_convert = stubbed_processor
 
         last_run = datetime(2024, 1, 1, 12, 0, 0)
-        mock_source = {
-            "url": "https://example.com/feed",
-            "extraction_code": None,
-            "last_successful_run": last_run.isoformat(),
-        }
-        mock_database.get_source_by_url.return_value = mock_source
-
-        processor.non_dated_processed_urls.append("https://example.com/duplicate")
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
+        memory_database.upsert_source_run("https://example.com/feed", last_run)
+
+        processor._remember_nondated("https://example.com/duplicate")
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed",
+            [
+                (
+                    "Old Article",
+                    "https://example.com/old",
+                    "Article before last run",
+                    "Sun, 31 Dec 2023 10:00:00 GMT",
                 ),
-                items=[
-                    ContentItem(
-                        title="Old Article",
-                        link="https://example.com/old",
-                        description="Article before last run",
-                        pubDate="Sun, 31 Dec 2023 10:00:00 GMT",
-                    ),
-                    ContentItem(
-                        title="New Article",
-                        link="https://example.com/new",
-                        description="Article after last run",
-                        pubDate="Mon, 02 Jan 2024 10:00:00 GMT",
-                    ),
-                    ContentItem(
-                        title="Duplicate Article",
-                        link="https://example.com/duplicate",
-                        description="Duplicate with no date",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Old Article",
-                    "link": "https://example.com/old",
-                    "description": "Article before last run",
-                    "pubDate": "Sun, 31 Dec 2023 10:00:00 GMT",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "New Article",
-                    "link": "https://example.com/new",
-                    "description": "Article after last run",
-                    "pubDate": "Mon, 02 Jan 2024 10:00:00 GMT",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "Duplicate Article",
-                    "link": "https://example.com/duplicate",
-                    "description": "Duplicate with no date",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-            ]
-
-            articles = processor.process_source("https://example.com/feed")
-
-            article_links = [article["link"] for article in articles]
-            assert (
-                "https://example.com/old" not in article_links
-            )  # Filtered by timestamp
-            assert "https://example.com/new" in article_links  # Passes both filters
-            assert (
-                "https://example.com/duplicate" not in article_links
-            )  # Filtered by URL
-            assert len(articles) == 1
+                (
+                    "New Article",
+                    "https://example.com/new",
+                    "Article after last run",
+                    "Mon, 02 Jan 2024 10:00:00 GMT",
+                ),
+                (
+                    "Duplicate Article",
+                    "https://example.com/duplicate",
+                    "Duplicate with no date",
+                ),
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        articles = processor.process_source("https://example.com/feed")
+
+        article_links = link_set(articles)
+        assert "https://example.com/old" not in article_links  # Filtered by timestamp
+        assert "https://example.com/new" in article_links  # Passes both filters
+        assert "https://example.com/duplicate" not in article_links  # Filtered by URL
+        assert len(articles) == 1
 
     def test_filtering_uses_article_link_field_for_comparison(
-        self, mock_config, mock_database
+        self, stubbed_processor, feed_factory
     ):
         """Test filtering uses article's link field for URL comparison."""
-        processor = ContentProcessor(mock_config, mock_database)
+        processor, mock_extract, mock_convert = stubbed_processor
 
         target_url = "https://example.com/target-article"
-        processor.non_dated_processed_urls.append(target_url)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Test Feed",
-                    link="https://example.com/feed",
-                    description="Test Feed",
+        processor._remember_nondated(target_url)
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Test Feed",
+            [
+                ("Target Article", target_url, "This article should be filtered"),
+                (
+                    "Other Article",
+                    "https://example.com/other",
+                    "This article should pass",
                 ),
-                items=[
-                    ContentItem(
-                        title="Target Article",
-                        link=target_url,
-                        description="This article should be filtered",
-                        pubDate="",
-                    ),
-                    ContentItem(
-                        title="Other Article",
-                        link="https://example.com/other",
-                        description="This article should pass",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Target Article",
-                    "link": target_url,
-                    "description": "This article should be filtered",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-                {
-                    "title": "Other Article",
-                    "link": "https://example.com/other",
-                    "description": "This article should pass",
-                    "pubDate": "",
-                    "source": "Test Feed",
-                },
-            ]
-
-            articles = processor.process_source("https://example.com/feed")
-
-            article_links = [article["link"] for article in articles]
-            assert target_url not in article_links
-            assert "https://example.com/other" in article_links
-            assert len(articles) == 1
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        articles = processor.process_source("https://example.com/feed")
+
+        article_links = link_set(articles)
+        assert target_url not in article_links
+        assert "https://example.com/other" in article_links
+        assert len(articles) == 1
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_filter_matches_reference_model(
+        self, processor_factory, memory_database, feed_factory, seed
+    ):
+        """Test randomized feeds against a reference model of the filtering rules.
+
+        An article is kept iff it is the first in the run carrying its link, the
+        link was not remembered earlier (preloaded), and it is either non-dated
+        or dated after the last run.
+        """
+        rng = random.Random(seed)
+        source_url = f"https://example.com/feed{seed}"
+        last_run = rng.choice([None, _MODEL_LAST_RUN])
+        if last_run is not None:
+            memory_database.upsert_source_run(source_url, last_run)
+
+        links = [f"https://example.com/{i}" for i in range(6)]
+        preloaded = set(rng.sample(links, rng.randint(0, 3)))
+        specs = [
+            (f"Article {i}", rng.choice(links), "", rng.choice(_MODEL_PUB_DATES))
+            for i in range(rng.randint(1, 12))
+        ]
+        mock_rss_feed, _ = feed_factory("Test Feed", specs)
+
+        processor = processor_factory(extract_return=mock_rss_feed)
+        for url in preloaded:
+            processor._remember_nondated(url)
+
+        articles = processor.process_source(source_url, record_run=False)
+
+        examined = set()
+        expected = []
+        for title, link, _, pub_date in specs:
+            if link in examined:
+                continue
+            examined.add(link)
+            if link in preloaded:
+                continue
+            parsed = parse_date(pub_date)
+            if (
+                parsed is not None
+                and last_run is not None
+                and parsed.replace(tzinfo=None) <= last_run
+            ):
+                continue
+            expected.append(title)
+        assert [article["title"] for article in articles] == expected
 
 
 @pytest.mark.integration
 class TestEndToEndDuplicatePrevention:
     """Test end-to-end duplicate prevention for the original problem scenario."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration object."""
-        config = Mock()
-        config.openrouter_api_key = "test-key"
-        config.cookie_file_path = None
-        return config
-
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database operations."""
-        db = Mock()
-        db.get_source_by_url.return_value = None
-        return db
-
     def test_consecutive_runs_with_fallback_dates_prevents_duplicates(
-        self, mock_config, mock_database
+        self, stubbed_processor, feed_factory
     ):
         """Test the original duplicate problem: consecutive runs with articles that fall back to current date."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Problematic Feed",
-                    link="https://example.com/feed",
-                    description="Problematic Feed",
+        processor, mock_extract, mock_convert = stubbed_processor
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Problematic Feed",
+            [
+                (
+                    "Article Without Date 1",
+                    "https://example.com/article1",
+                    "This article has no date and would cause duplicates",
                 ),
-                items=[
-                    ContentItem(
-                        title="Article Without Date 1",
-                        link="https://example.com/article1",
-                        description="This article has no date and would cause duplicates",
-                        pubDate="",
-                    ),
-                    ContentItem(
-                        title="Article Without Date 2",
-                        link="https://example.com/article2",
-                        description="This article also has no date",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Article Without Date 1",
-                    "link": "https://example.com/article1",
-                    "description": "This article has no date and would cause duplicates",
-                    "pubDate": "",
-                    "source": "Problematic Feed",
-                },
-                {
-                    "title": "Article Without Date 2",
-                    "link": "https://example.com/article2",
-                    "description": "This article also has no date",
-                    "pubDate": "",
-                    "source": "Problematic Feed",
-                },
-            ]
-
-            first_run_articles = processor.process_source("https://example.com/feed")
-
-            first_run_links = [article["link"] for article in first_run_articles]
-            assert "https://example.com/article1" in first_run_links
-            assert "https://example.com/article2" in first_run_links
-            assert len(first_run_articles) == 2
-
-            assert "https://example.com/article1" in processor.non_dated_processed_urls
-            assert "https://example.com/article2" in processor.non_dated_processed_urls
-
-            second_run_articles = processor.process_source("https://example.com/feed")
-
-            assert len(second_run_articles) == 0
-
-    def test_mixed_articles_with_and_without_dates(self, mock_config, mock_database):
+                (
+                    "Article Without Date 2",
+                    "https://example.com/article2",
+                    "This article also has no date",
+                ),
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        first_run_articles = processor.process_source("https://example.com/feed")
+
+        first_run_links = link_set(first_run_articles)
+        assert "https://example.com/article1" in first_run_links
+        assert "https://example.com/article2" in first_run_links
+        assert len(first_run_articles) == 2
+
+        assert "https://example.com/article1" in processor.non_dated_processed_urls
+        assert "https://example.com/article2" in processor.non_dated_processed_urls
+
+        second_run_articles = processor.process_source("https://example.com/feed")
+
+        assert len(second_run_articles) == 0
+
+    def test_repeated_url_within_one_feed_returned_once(
+        self, stubbed_processor, feed_factory
+    ):
+        """Test an article repeated inside a single feed is only returned once."""
+        processor, mock_extract, mock_convert = stubbed_processor
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Repeating Feed",
+            [
+                (
+                    "Article Without Date",
+                    "https://example.com/article1",
+                    "Listed twice by the feed",
+                ),
+                (
+                    "Article Without Date (repost)",
+                    "https://example.com/article1",
+                    "Listed twice by the feed",
+                ),
+                ("Other Article", "https://example.com/article2", "Listed once"),
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        first_run_articles = processor.process_source("https://example.com/feed")
+
+        assert [article["title"] for article in first_run_articles] == [
+            "Article Without Date",
+            "Other Article",
+        ]
+        assert list(processor.non_dated_processed_urls) == [
+            "https://example.com/article1",
+            "https://example.com/article2",
+        ]
+
+        second_run_articles = processor.process_source("https://example.com/feed")
+        assert second_run_articles == []
+
+    def test_mixed_articles_with_and_without_dates(
+        self, stubbed_processor, feed_factory
+    ):
         """Test mixed scenario: some articles with dates, some without."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Mixed Feed",
-                    link="https://example.com/feed",
-                    description="Mixed Feed",
+        processor, mock_extract, mock_convert = stubbed_processor
+
+        mock_rss_feed, feed_articles = feed_factory(
+            "Mixed Feed",
+            [
+                (
+                    "Article With Date",
+                    "https://example.com/dated",
+                    "This article has a proper date",
+                    "Mon, 01 Jan 2024 12:00:00 GMT",
                 ),
-                items=[
-                    ContentItem(
-                        title="Article With Date",
-                        link="https://example.com/dated",
-                        description="This article has a proper date",
-                        pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
-                    ),
-                    ContentItem(
-                        title="Article Without Date",
-                        link="https://example.com/undated",
-                        description="This article has no date",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": "Article With Date",
-                    "link": "https://example.com/dated",
-                    "description": "This article has a proper date",
-                    "pubDate": "Mon, 01 Jan 2024 12:00:00 GMT",
-                    "source": "Mixed Feed",
-                },
-                {
-                    "title": "Article Without Date",
-                    "link": "https://example.com/undated",
-                    "description": "This article has no date",
-                    "pubDate": "",
-                    "source": "Mixed Feed",
-                },
-            ]
-
-            first_run_articles = processor.process_source("https://example.com/feed")
-
-            first_run_links = [article["link"] for article in first_run_articles]
-            assert "https://example.com/dated" in first_run_links
-            assert "https://example.com/undated" in first_run_links
-            assert len(first_run_articles) == 2
-
-            assert "https://example.com/undated" in processor.non_dated_processed_urls
-            assert "https://example.com/dated" not in processor.non_dated_processed_urls
-
-            second_run_articles = processor.process_source("https://example.com/feed")
-
-            second_run_links = [article["link"] for article in second_run_articles]
-            assert "https://example.com/dated" in second_run_links
-            assert "https://example.com/undated" not in second_run_links
-            assert len(second_run_articles) == 1
+                (
+                    "Article Without Date",
+                    "https://example.com/undated",
+                    "This article has no date",
+                ),
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed
+        mock_convert.return_value = feed_articles
+
+        first_run_articles = processor.process_source("https://example.com/feed")
+
+        first_run_links = link_set(first_run_articles)
+        assert "https://example.com/dated" in first_run_links
+        assert "https://example.com/undated" in first_run_links
+        assert len(first_run_articles) == 2
+
+        assert "https://example.com/undated" in processor.non_dated_processed_urls
+        assert "https://example.com/dated" not in processor.non_dated_processed_urls
+
+        # The first run was recorded, so the dated article is now filtered by
+        # timestamp while the undated one is filtered by the tracked URL
+        second_run_articles = processor.process_source("https://example.com/feed")
+
+        assert second_run_articles == []
 
     def test_new_articles_after_duplicates_are_tracked(
-        self, mock_config, mock_database
+        self, stubbed_processor, feed_factory
     ):
         """Test that new articles are included even after duplicates are tracked."""
-        processor = ContentProcessor(mock_config, mock_database)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed_1 = ContentFeed(
-                channel=ContentChannel(
-                    title="Growing Feed",
-                    link="https://example.com/feed",
-                    description="Growing Feed",
+        processor, mock_extract, mock_convert = stubbed_processor
+
+        mock_rss_feed_1, feed_articles = feed_factory(
+            "Growing Feed",
+            [
+                (
+                    "Original Article",
+                    "https://example.com/original",
+                    "First article without date",
                 ),
-                items=[
-                    ContentItem(
-                        title="Original Article",
-                        link="https://example.com/original",
-                        description="First article without date",
-                        pubDate="",
-                    )
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed_1
-            mock_convert.return_value = [
-                {
-                    "title": "Original Article",
-                    "link": "https://example.com/original",
-                    "description": "First article without date",
-                    "pubDate": "",
-                    "source": "Growing Feed",
-                }
-            ]
-
-            first_run_articles = processor.process_source("https://example.com/feed")
-            assert len(first_run_articles) == 1
-            assert "https://example.com/original" in processor.non_dated_processed_urls
-
-            mock_rss_feed_2 = ContentFeed(
-                channel=ContentChannel(
-                    title="Growing Feed",
-                    link="https://example.com/feed",
-                    description="Growing Feed",
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed_1
+        mock_convert.return_value = feed_articles
+
+        first_run_articles = processor.process_source("https://example.com/feed")
+        assert len(first_run_articles) == 1
+        assert "https://example.com/original" in processor.non_dated_processed_urls
+
+        mock_rss_feed_2, feed_articles = feed_factory(
+            "Growing Feed",
+            [
+                (
+                    "Original Article",
+                    "https://example.com/original",
+                    "First article without date",
                 ),
-                items=[
-                    ContentItem(
-                        title="Original Article",
-                        link="https://example.com/original",
-                        description="First article without date",
-                        pubDate="",
-                    ),
-                    ContentItem(
-                        title="New Article",
-                        link="https://example.com/new",
-                        description="New article without date",
-                        pubDate="",
-                    ),
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed_2
-            mock_convert.return_value = [
-                {
-                    "title": "Original Article",
-                    "link": "https://example.com/original",
-                    "description": "First article without date",
-                    "pubDate": "",
-                    "source": "Growing Feed",
-                },
-                {
-                    "title": "New Article",
-                    "link": "https://example.com/new",
-                    "description": "New article without date",
-                    "pubDate": "",
-                    "source": "Growing Feed",
-                },
-            ]
-
-            second_run_articles = processor.process_source("https://example.com/feed")
-
-            second_run_links = [article["link"] for article in second_run_articles]
-            assert (
-                "https://example.com/original" not in second_run_links
-            )  # Filtered as duplicate
-            assert "https://example.com/new" in second_run_links  # New article included
-            assert len(second_run_articles) == 1
-
-            assert "https://example.com/original" in processor.non_dated_processed_urls
-            assert "https://example.com/new" in processor.non_dated_processed_urls
+                ("New Article", "https://example.com/new", "New article without date"),
+            ],
+        )
+        mock_extract.return_value = mock_rss_feed_2
+        mock_convert.return_value = feed_articles
+
+        second_run_articles = processor.process_source("https://example.com/feed")
+
+        second_run_links = link_set(second_run_articles)
+        assert (
+            "https://example.com/original" not in second_run_links
+        )  # Filtered as duplicate
+        assert "https://example.com/new" in second_run_links  # New article included
+        assert len(second_run_articles) == 1
+
+        assert "https://example.com/original" in processor.non_dated_processed_urls
+        assert "https://example.com/new" in processor.non_dated_processed_urls
 
     def test_deque_bounded_behavior_with_many_articles(
-        self, mock_config, mock_database
+        self, processor_factory, feed_factory
     ):
         """Test that deque properly handles bounds when many articles are processed."""
-        processor = ContentProcessor(mock_config, mock_database, max_fallback_urls=3)
-
-        with (
-            patch.object(processor.hiku_extractor, "extract") as mock_extract,
-            patch.object(processor, "_content_feed_to_articles") as mock_convert,
-        ):
-            mock_rss_feed = ContentFeed(
-                channel=ContentChannel(
-                    title="Large Feed",
-                    link="https://example.com/feed",
-                    description="Large Feed",
-                ),
-                items=[
-                    ContentItem(
-                        title=f"Article {i}",
-                        link=f"https://example.com/article{i}",
-                        description=f"Article {i}",
-                        pubDate="",
-                    )
-                    for i in range(1, 6)
-                ],
-            )
-            mock_extract.return_value = mock_rss_feed
-            mock_convert.return_value = [
-                {
-                    "title": f"Article {i}",
-                    "link": f"https://example.com/article{i}",
-                    "description": f"Article {i}",
-                    "pubDate": "",
-                    "source": "Large Feed",
-                }
+        mock_rss_feed, feed_articles = feed_factory(
+            "Large Feed",
+            [
+                (f"Article {i}", f"https://example.com/article{i}", f"Article {i}")
                 for i in range(1, 6)
-            ]
+            ],
+        )
+        processor = processor_factory(mock_rss_feed, feed_articles, max_fallback_urls=3)
 
-            articles = processor.process_source("https://example.com/feed")
+        articles = processor.process_source("https://example.com/feed")
 
-            assert len(articles) == 5
+        assert len(articles) == 5
 
-            assert len(processor.non_dated_processed_urls) == 3
+        assert len(processor.non_dated_processed_urls) == 3
+
+        deque_urls = list(processor.non_dated_processed_urls)
+        assert "https://example.com/article3" in deque_urls
+        assert "https://example.com/article4" in deque_urls
+        assert "https://example.com/article5" in deque_urls
+
+        assert "https://example.com/article1" not in deque_urls
+        assert "https://example.com/article2" not in deque_urls
+
+    def test_lru_evicts_least_recently_seen_url(self, processor_factory):
+        """Test the bounded URL set evicts the least recently seen URL."""
+        processor = processor_factory(max_fallback_urls=2)
+
+        for i in range(1, 4):
+            processor._remember_nondated(f"https://example.com/article{i}")
+        processor._remember_nondated("https://example.com/article3")
+
+        assert list(processor.non_dated_processed_urls) == [
+            "https://example.com/article2",
+            "https://example.com/article3",
+        ]
+        assert "https://example.com/article1" not in processor.non_dated_processed_urls
+        assert "https://example.com/article2" in processor.non_dated_processed_urls
+
+    def test_url_still_in_feed_survives_eviction(self, processor_factory, feed_factory):
+        """Test a remembered URL that keeps reappearing is not evicted by newer ones."""
+        mock_rss_feed, feed_articles = feed_factory(
+            "Growing Feed",
+            [
+                ("Original", "https://example.com/original", "Still in the feed"),
+                ("New", "https://example.com/new", "Fresh article"),
+            ],
+        )
+        processor = processor_factory(mock_rss_feed, feed_articles, max_fallback_urls=2)
+        processor._remember_nondated("https://example.com/original")
+        processor._remember_nondated("https://example.com/other")
 
-            deque_urls = list(processor.non_dated_processed_urls)
-            assert "https://example.com/article3" in deque_urls
-            assert "https://example.com/article4" in deque_urls
-            assert "https://example.com/article5" in deque_urls
+        articles = processor.process_source("https://example.com/feed")
 
-            assert "https://example.com/article1" not in deque_urls
-            assert "https://example.com/article2" not in deque_urls
+        assert link_set(articles) == {"https://example.com/new"}
+        assert list(processor.non_dated_processed_urls) == [
+            "https://example.com/original",
+            "https://example.com/new",
+        ]
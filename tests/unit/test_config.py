@@ -2,9 +2,8 @@
 # ABOUTME: Validates YAML config loading with all API keys, newsletter settings, and validation
 
 import pytest
-import os
-import tempfile
 import yaml
+from unittest.mock import patch
 
 from yomu.config.config import Config
 
@@ -23,27 +22,23 @@ class TestConfig:
             "frequencies": ["0 9 * * *", "0 17 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
+        text = yaml.safe_dump(config_data)
 
-            config = Config.load_from_file(f.name)
+        config = Config.load_from_string(text)
 
-            assert config.openrouter_api_key == "test-api-key"
-            assert config.sender_email == "test@gmail.com"
-            assert config.sender_password == "test-app-password"
-            assert config.recipient_email == "user@example.com"
-            assert config.sources == [
-                "https://example.com/rss",
-                "https://news.ycombinator.com",
-            ]
-            assert config.frequencies == ["0 9 * * *", "0 17 * * *"]
-            assert config.max_articles_per_source == 3  # Default value
-            assert config.cookie_file_path == ""  # Default value
-            assert config.smtp_server == "smtp.gmail.com"  # Default SMTP server
-            assert config.smtp_port == 587  # Default SMTP port
-
-        os.unlink(f.name)
+        assert config.openrouter_api_key == "test-api-key"
+        assert config.sender_email == "test@gmail.com"
+        assert config.sender_password == "test-app-password"
+        assert config.recipient_email == "user@example.com"
+        assert config.sources == [
+            "https://example.com/rss",
+            "https://news.ycombinator.com",
+        ]
+        assert config.frequencies == ["0 9 * * *", "0 17 * * *"]
+        assert config.max_articles_per_source == 3  # Default value
+        assert config.cookie_file_path == ""  # Default value
+        assert config.smtp_server == "smtp.gmail.com"  # Default SMTP server
+        assert config.smtp_port == 587  # Default SMTP port
 
     def test_config_loads_optional_fields(self):
         """Test that config loads optional fields with custom values."""
@@ -58,16 +53,12 @@ class TestConfig:
             "cookie_file_path": "/path/to/cookies.txt",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            config = Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-            assert config.max_articles_per_source == 10
-            assert config.cookie_file_path == "/path/to/cookies.txt"
+        config = Config.load_from_string(text)
 
-        os.unlink(f.name)
+        assert config.max_articles_per_source == 10
+        assert config.cookie_file_path == "/path/to/cookies.txt"
 
     def test_config_raises_error_for_missing_required_field(self):
         """Test that config raises ConfigError for missing required fields."""
@@ -79,16 +70,10 @@ class TestConfig:
             "frequencies": ["0 9 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(
-                ValueError, match=".*required.*"
-            ):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match=".*required.*"):
+            Config.load_from_string(text)
 
     def test_config_validates_email_format(self):
         """Test that config validates email format."""
@@ -101,14 +86,10 @@ class TestConfig:
             "frequencies": ["0 9 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
+        text = yaml.safe_dump(config_data)
 
-            with pytest.raises(ValueError, match="Invalid email format"):
-                Config.load_from_file(f.name)
-
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match="Invalid email format"):
+            Config.load_from_string(text)
 
     def test_config_validates_user_email_format(self):
         """Test that config validates user email format."""
@@ -121,14 +102,10 @@ class TestConfig:
             "frequencies": ["0 9 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(ValueError, match="Invalid email format"):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match="Invalid email format"):
+            Config.load_from_string(text)
 
     def test_config_validates_sources_list(self):
         """Test that config validates sources as a list."""
@@ -141,16 +118,10 @@ class TestConfig:
             "frequencies": ["0 9 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(
-                ValueError, match=".*field type.*"
-            ):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match=".*field type.*"):
+            Config.load_from_string(text)
 
     def test_config_validates_empty_sources(self):
         """Test that config validates non-empty sources list."""
@@ -163,14 +134,10 @@ class TestConfig:
             "frequencies": ["0 9 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
+        text = yaml.safe_dump(config_data)
 
-            with pytest.raises(ValueError, match=".*empty.*"):
-                Config.load_from_file(f.name)
-
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match=".*empty.*"):
+            Config.load_from_string(text)
 
     def test_config_validates_source_urls(self):
         """Test that config validates individual source URLs."""
@@ -183,14 +150,10 @@ class TestConfig:
             "frequencies": ["0 9 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(ValueError, match="Invalid URL"):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match="Invalid URL"):
+            Config.load_from_string(text)
 
     def test_config_validates_frequencies_list(self):
         """Test that config validates frequencies as a list."""
@@ -203,16 +166,10 @@ class TestConfig:
             "frequencies": "not-a-list",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(
-                ValueError, match=".*field type.*"
-            ):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match=".*field type.*"):
+            Config.load_from_string(text)
 
     def test_config_validates_empty_frequencies(self):
         """Test that config validates non-empty frequencies list."""
@@ -225,14 +182,10 @@ class TestConfig:
             "frequencies": [],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
+        text = yaml.safe_dump(config_data)
 
-            with pytest.raises(ValueError, match=".*empty.*"):
-                Config.load_from_file(f.name)
-
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match=".*empty.*"):
+            Config.load_from_string(text)
 
     def test_config_validates_cron_expressions(self):
         """Test that config validates cron expression syntax."""
@@ -245,14 +198,10 @@ class TestConfig:
             "frequencies": ["invalid cron"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(ValueError, match="Invalid cron expression"):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match="Invalid cron expression"):
+            Config.load_from_string(text)
 
     def test_config_validates_smtp_port_range(self):
         """Test that config validates SMTP port is within valid range."""
@@ -267,26 +216,22 @@ class TestConfig:
             "smtp_port": 0,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
+        text = yaml.safe_dump(config_data)
 
-            with pytest.raises(ValueError, match="SMTP port must be an integer between 1 and 65535"):
-                Config.load_from_file(f.name)
-
-        os.unlink(f.name)
+        with pytest.raises(
+            ValueError, match="SMTP port must be an integer between 1 and 65535"
+        ):
+            Config.load_from_string(text)
 
         # Test port too high
         config_data["smtp_port"] = 65536
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(ValueError, match="SMTP port must be an integer between 1 and 65535"):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(
+            ValueError, match="SMTP port must be an integer between 1 and 65535"
+        ):
+            Config.load_from_string(text)
 
     def test_config_loads_custom_smtp_settings(self):
         """Test that config loads custom SMTP server and port values."""
@@ -301,15 +246,63 @@ class TestConfig:
             "smtp_port": 465,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            config = Config.load_from_file(f.name)
-            assert config.smtp_server == "mail.example.com"
-            assert config.smtp_port == 465
-
-        os.unlink(f.name)
+        text = yaml.safe_dump(config_data)
+
+        config = Config.load_from_string(text)
+        assert config.smtp_server == "mail.example.com"
+        assert config.smtp_port == 465
+
+    def test_config_rejects_unknown_attributes(self):
+        """Test that Config uses slots, so misspelled settings fail loudly."""
+        config = Config(
+            openrouter_api_key="test-api-key",
+            sender_email="test@gmail.com",
+            sender_password="test-app-password",
+        )
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.smtp_prot = 465
+
+    def test_crons_reuse_validated_iterators(self):
+        """Test that crons() returns the iterators parsed during validation."""
+        config = Config(
+            openrouter_api_key="test-api-key",
+            sender_email="test@gmail.com",
+            sender_password="test-app-password",
+            recipient_email="user@example.com",
+            sources=["https://example.com/rss"],
+            frequencies=["0 9 * * *", "0 17 * * *"],
+        )
+        config.validate()
+
+        with patch("yomu.config.config.croniter") as mock_croniter:
+            first = config.crons()
+            second = config.crons()
+
+        mock_croniter.assert_not_called()
+        assert len(first) == 2
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_crons_reparsed_when_frequencies_change(self):
+        """Test that stale validated iterators are not reused for other expressions."""
+        config = Config(
+            openrouter_api_key="test-api-key",
+            sender_email="test@gmail.com",
+            sender_password="test-app-password",
+            recipient_email="user@example.com",
+            sources=["https://example.com/rss"],
+            frequencies=["0 9 * * *", "0 17 * * *"],
+        )
+        config.validate()
+        config.frequencies = ["0 17 * * *", "30 6 * * 1"]
+
+        crons = config.crons()
+
+        assert [cron.expressions for cron in crons] == [
+            ["0", "17", "*", "*", "*"],
+            ["30", "6", "*", "*", "1"],
+        ]
 
     def test_config_file_not_found(self):
         """Test that config raises FileNotFoundError for missing file."""
@@ -318,14 +311,10 @@ class TestConfig:
 
     def test_config_invalid_yaml_syntax(self):
         """Test that config raises ValueError for invalid YAML syntax."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("invalid: yaml: syntax: [")
-            f.flush()
-
-            with pytest.raises(ValueError, match="Invalid YAML syntax"):
-                Config.load_from_file(f.name)
+        text = "invalid: yaml: syntax: ["
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match="Invalid YAML syntax"):
+            Config.load_from_string(text)
 
     def test_config_allows_multiple_frequencies(self):
         """Test that config supports multiple frequency schedules."""
@@ -342,17 +331,13 @@ class TestConfig:
             ],  # Multiple valid schedules
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
+        text = yaml.safe_dump(config_data)
 
-            config = Config.load_from_file(f.name)
-            assert len(config.frequencies) == 3
-            assert "0 9 * * *" in config.frequencies
-            assert "0 17 * * *" in config.frequencies
-            assert "0 21 * * 0" in config.frequencies
-
-        os.unlink(f.name)
+        config = Config.load_from_string(text)
+        assert len(config.frequencies) == 3
+        assert "0 9 * * *" in config.frequencies
+        assert "0 17 * * *" in config.frequencies
+        assert "0 21 * * 0" in config.frequencies
 
     def test_config_loads_max_description_length_default(self):
         """Test that config loads max_description_length with default value."""
@@ -365,14 +350,10 @@ class TestConfig:
             "frequencies": ["0 9 * * *"],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            config = Config.load_from_file(f.name)
-            assert config.max_description_length == 200  # Default value
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        config = Config.load_from_string(text)
+        assert config.max_description_length == 200  # Default value
 
     def test_config_loads_custom_max_description_length(self):
         """Test that config loads custom max_description_length value."""
@@ -386,14 +367,10 @@ class TestConfig:
             "max_description_length": 150,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            config = Config.load_from_file(f.name)
-            assert config.max_description_length == 150
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        config = Config.load_from_string(text)
+        assert config.max_description_length == 150
 
     def test_config_validates_max_description_length_type(self):
         """Test that config validates max_description_length is a positive integer."""
@@ -407,16 +384,10 @@ class TestConfig:
             "max_description_length": "not-an-integer",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
+        text = yaml.safe_dump(config_data)
 
-            with pytest.raises(
-                ValueError, match=".*positive.*"
-            ):
-                Config.load_from_file(f.name)
-
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match=".*positive.*"):
+            Config.load_from_string(text)
 
     def test_config_validates_max_description_length_positive(self):
         """Test that config validates max_description_length is positive."""
@@ -430,13 +401,7 @@ class TestConfig:
             "max_description_length": -50,
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            f.flush()
-
-            with pytest.raises(
-                ValueError, match=".*positive.*"
-            ):
-                Config.load_from_file(f.name)
+        text = yaml.safe_dump(config_data)
 
-        os.unlink(f.name)
+        with pytest.raises(ValueError, match=".*positive.*"):
+            Config.load_from_string(text)
@@ -2,34 +2,92 @@
 # ABOUTME: Tests Hiku-based content extraction and conversion to article format
 
 import pytest
+import threading
 from unittest.mock import Mock, patch
 from pydantic import ValidationError
 from yomu.content.schema import ContentFeed, ContentChannel, ContentItem
 from yomu.content.processor import ContentProcessor
+from yomu.database.database import Database
+
+
+# Feeds are read-only test inputs, so they are validated once at import
+_SINGLE_ITEM_FEED = ContentFeed(
+    channel=ContentChannel(
+        title="Test Feed",
+        link="https://example.com",
+        description="Test Description",
+    ),
+    items=[
+        ContentItem(
+            title="Test Article",
+            link="https://example.com/article",
+            description="Article description",
+            pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
+        )
+    ],
+)
+_MULTI_ITEM_FEED = ContentFeed(
+    channel=ContentChannel(title="Multi Feed", link="https://example.com"),
+    items=[
+        ContentItem(
+            title=f"Article {i}",
+            link=f"https://example.com/{i}",
+            description=f"Desc {i}",
+            pubDate=f"Mon, 01 Jan 2024 {9 + i}:00:00 GMT",
+        )
+        for i in range(1, 4)
+    ],
+)
+_MINIMAL_FEED = ContentFeed(
+    channel=ContentChannel(title="Minimal Feed"),
+    items=[ContentItem(title="Minimal Article", link="https://example.com/minimal")],
+)
+_SPECIAL_CHARS_FEED = ContentFeed(
+    channel=ContentChannel(title="Feed with & Special < Characters >"),
+    items=[
+        ContentItem(
+            title="Title with 'quotes' and \"double quotes\"",
+            link="https://example.com/article?param=value&other=123",
+            description="Description with <html> tags & entities",
+            pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
+        )
+    ],
+)
 
 
-class TestContentProcessorHikuInitialization:
-    """Test ContentProcessor Hiku extractor initialization."""
+@pytest.fixture
+def mock_config(make_config):
+    """Config stub with API key and cookie path."""
+    return make_config(
+        openrouter_api_key="test-openrouter-key",
+        cookie_file_path="/path/to/cookies.txt",
+    )
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration object."""
-        config = Mock()
-        config.openrouter_api_key = "test-openrouter-key"
-        config.cookie_file_path = "/path/to/cookies.txt"
-        return config
 
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database operations."""
-        db = Mock()
-        return db
+@pytest.fixture
+def mock_database():
+    """Mock database operations."""
+    return Mock(spec_set=Database)
+
+
+@pytest.fixture(scope="module")
+def shared_processor(make_config):
+    """One processor reused by the conversion tests, which never mutate it."""
+    return ContentProcessor(
+        config=make_config(cookie_file_path=None),
+        database=Mock(spec_set=Database),
+        extractor=Mock(),
+    )
+
+
+class TestContentProcessorHikuInitialization:
+    """Test ContentProcessor Hiku extractor initialization."""
 
     def test_initialization_complete_setup(self, mock_config, mock_database):
         """Test ContentProcessor full initialization with config, extractor, and logger."""
         from yomu.content.processor import ContentProcessor
 
-        with patch("yomu.content.processor.HikuExtractor") as mock_extractor_class:
+        with patch("hikugen.HikuExtractor") as mock_extractor_class:
             mock_extractor_instance = Mock()
             mock_extractor_class.return_value = mock_extractor_instance
 
@@ -43,22 +101,96 @@ class TestContentProcessorHikuInitialization:
                 db_path="yomu.db",
             )
 
+    def test_extractor_built_on_first_use(self, mock_config, mock_database):
+        """Test that the default HikuExtractor is only built when first accessed."""
+        from yomu.content.processor import ContentProcessor
 
-class TestContentProcessorIntegration:
-    """Test end-to-end integration of ContentProcessor with Hiku."""
+        with patch("hikugen.HikuExtractor") as mock_extractor_class:
+            processor = ContentProcessor(config=mock_config, database=mock_database)
+            mock_extractor_class.assert_not_called()
+
+            first = processor.hiku_extractor
+            second = processor.hiku_extractor
+
+        assert first is second is mock_extractor_class.return_value
+        mock_extractor_class.assert_called_once()
+
+    def test_each_thread_gets_its_own_extractor(self, mock_config, mock_database):
+        """Test that threads never share a default extractor."""
+        from yomu.content.processor import ContentProcessor
+
+        worker_extractors = []
+        with patch("hikugen.HikuExtractor", side_effect=lambda **kwargs: Mock()):
+            processor = ContentProcessor(config=mock_config, database=mock_database)
+            main_extractor = processor.hiku_extractor
+            for _ in range(2):
+                worker = threading.Thread(
+                    target=lambda: worker_extractors.append(processor.hiku_extractor)
+                )
+                worker.start()
+                worker.join()
+
+        first_worker_extractor, second_worker_extractor = worker_extractors
+        assert main_extractor is not first_worker_extractor
+        assert first_worker_extractor is not second_worker_extractor
+        main_extractor.database.close.assert_not_called()
+
+    def test_close_extractors_releases_every_thread_extractor(
+        self, mock_config, mock_database
+    ):
+        """Test that closing releases all built extractors and later access rebuilds."""
+        from yomu.content.processor import ContentProcessor
+
+        with patch("hikugen.HikuExtractor", side_effect=lambda **kwargs: Mock()):
+            processor = ContentProcessor(config=mock_config, database=mock_database)
+            worker_extractors = []
+            worker = threading.Thread(
+                target=lambda: worker_extractors.append(processor.hiku_extractor)
+            )
+            worker.start()
+            worker.join()
+            main_extractor = processor.hiku_extractor
+
+            processor.close_extractors()
+            rebuilt_extractor = processor.hiku_extractor
+
+        worker_extractors[0].database.close.assert_called_once()
+        main_extractor.database.close.assert_called_once()
+        assert rebuilt_extractor is not main_extractor
+        rebuilt_extractor.database.close.assert_not_called()
+
+    def test_close_extractors_leaves_injected_extractor_open(
+        self, mock_config, mock_database
+    ):
+        """Test that an injected extractor is not closed by the processor."""
+        from yomu.content.processor import ContentProcessor
+
+        extractor = Mock()
+        processor = ContentProcessor(
+            config=mock_config, database=mock_database, extractor=extractor
+        )
+
+        processor.close_extractors()
+
+        extractor.database.close.assert_not_called()
+        assert processor.hiku_extractor is extractor
+
+    def test_initialization_with_injected_extractor(self, mock_config, mock_database):
+        """Test that an injected extractor is used without building a HikuExtractor."""
+        from yomu.content.processor import ContentProcessor
+
+        extractor = Mock()
+        with patch("hikugen.HikuExtractor") as mock_extractor_class:
+            processor = ContentProcessor(
+                config=mock_config, database=mock_database, extractor=extractor
+            )
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration object."""
-        config = Mock()
-        config.openrouter_api_key = "test-key"
-        config.cookie_file_path = "/path/to/cookies.txt"
-        return config
+        assert processor.hiku_extractor is extractor
+        mock_extractor_class.assert_not_called()
 
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database operations."""
-        return Mock()
+
+class TestContentProcessorIntegration:
+    """Test end-to-end integration of ContentProcessor with Hiku."""
 
     def test_content_feed_to_articles_conversion(self, mock_config, mock_database):
         """Test conversion of ContentFeed to article format."""
@@ -84,122 +216,60 @@ class TestContentProcessorIntegration:
             ],
         )
 
-        with patch("yomu.content.processor.HikuExtractor"):
-            processor = ContentProcessor(config=mock_config, database=mock_database)
+        processor = ContentProcessor(
+            config=mock_config, database=mock_database, extractor=Mock()
+        )
 
-            articles = processor._content_feed_to_articles(
-                mock_rss_feed, "https://example.com"
-            )
+        articles = processor._content_feed_to_articles(
+            mock_rss_feed, "https://example.com"
+        )
 
-            assert len(articles) == 2
-            assert articles[0]["title"] == "AI Breakthrough"
-            assert articles[0]["link"] == "https://example.com/ai"
-            assert articles[0]["source"] == "Tech News"
-            assert articles[1]["title"] == "Cloud Computing"
-            assert articles[1]["link"] == "https://example.com/cloud"
+        assert len(articles) == 2
+        assert articles[0]["title"] == "AI Breakthrough"
+        assert articles[0]["link"] == "https://example.com/ai"
+        assert articles[0]["source"] == "Tech News"
+        assert articles[1]["title"] == "Cloud Computing"
+        assert articles[1]["link"] == "https://example.com/cloud"
 
     def test_conversion_with_single_item_feed(self, mock_config, mock_database):
         """Test conversion when ContentFeed has a single item."""
         from yomu.content.processor import ContentProcessor
 
-        mock_rss_feed = ContentFeed(
-            channel=ContentChannel(title="Single Item Feed"),
-            items=[
-                ContentItem(
-                    title="Single Article",
-                    link="https://example.com/article",
-                    description="Article description",
-                    pubDate="Mon, 01 Jan 2024 10:00:00 GMT",
-                )
-            ],
+        processor = ContentProcessor(
+            config=mock_config, database=mock_database, extractor=Mock()
+        )
+        articles = processor._content_feed_to_articles(
+            _SINGLE_ITEM_FEED, "https://example.com"
         )
 
-        with patch("yomu.content.processor.HikuExtractor"):
-            processor = ContentProcessor(config=mock_config, database=mock_database)
-            articles = processor._content_feed_to_articles(
-                mock_rss_feed, "https://example.com"
-            )
-
-            assert len(articles) == 1
-            assert articles[0]["title"] == "Single Article"
+        assert len(articles) == 1
+        assert articles[0]["title"] == "Test Article"
 
     def test_process_source_propagates_hiku_errors(self, mock_config, mock_database):
         """Test that errors from Hiku propagate through process_source."""
         from yomu.content.processor import ContentProcessor
 
-        with patch("yomu.content.processor.HikuExtractor") as mock_extractor_class:
-            mock_extractor_instance = Mock()
-            mock_extractor_instance.extract.side_effect = RuntimeError("Hiku failed")
-            mock_extractor_class.return_value = mock_extractor_instance
-
-            processor = ContentProcessor(config=mock_config, database=mock_database)
-
-            with pytest.raises(RuntimeError) as exc_info:
-                processor.process_source("https://example.com")
-
-            assert "Hiku failed" in str(exc_info.value)
-
-    def test_conversion_with_minimal_required_fields(self, mock_config, mock_database):
-        """Test conversion of ContentFeed with only required fields."""
-        from yomu.content.processor import ContentProcessor
-
-        mock_rss_feed = ContentFeed(
-            channel=ContentChannel(title="Minimal Feed"),
-            items=[
-                ContentItem(
-                    title="Minimal Article",
-                    link="https://example.com/minimal",
-                )
-            ],
+        extractor = Mock()
+        extractor.extract.side_effect = RuntimeError("Hiku failed")
+        processor = ContentProcessor(
+            config=mock_config, database=mock_database, extractor=extractor
         )
 
-        with patch("yomu.content.processor.HikuExtractor"):
-            processor = ContentProcessor(config=mock_config, database=mock_database)
-            articles = processor._content_feed_to_articles(
-                mock_rss_feed, "https://example.com"
-            )
-
-            assert len(articles) == 1
-            assert articles[0]["title"] == "Minimal Article"
-            assert articles[0]["link"] == "https://example.com/minimal"
-            assert articles[0]["description"] == ""
-            assert articles[0]["pubDate"] == ""
-            assert articles[0]["source"] == "Minimal Feed"
+        with pytest.raises(RuntimeError) as exc_info:
+            processor.process_source("https://example.com")
 
-
-def _create_processor():
-    """Helper to create ContentProcessor with mocked HikuExtractor."""
-    config = Mock()
-    config.openrouter_api_key = "test-key"
-    config.cookie_file_path = None
-    with patch("yomu.content.processor.HikuExtractor"):
-        return ContentProcessor(config=config, database=Mock())
+        assert "Hiku failed" in str(exc_info.value)
 
 
 class TestContentFeedToArticlesConversion:
     """Test conversion from ContentFeed Pydantic model to article format."""
 
-    def test_single_item_conversion(self):
+    def test_single_item_conversion(self, shared_processor):
         """Test converting ContentFeed with one item to article dict."""
-        feed = ContentFeed(
-            channel=ContentChannel(
-                title="Test Feed",
-                link="https://example.com",
-                description="Test Description",
-            ),
-            items=[
-                ContentItem(
-                    title="Test Article",
-                    link="https://example.com/article",
-                    description="Article description",
-                    pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
-                )
-            ],
+        articles = shared_processor._content_feed_to_articles(
+            _SINGLE_ITEM_FEED, "https://example.com"
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
-
         assert len(articles) == 1
         assert articles[0]["title"] == "Test Article"
         assert articles[0]["link"] == "https://example.com/article"
@@ -207,89 +277,50 @@ class TestContentFeedToArticlesConversion:
         assert articles[0]["pubDate"] == "Mon, 01 Jan 2024 12:00:00 GMT"
         assert articles[0]["source"] == "Test Feed"
 
-    def test_multiple_items_conversion(self):
+    def test_multiple_items_conversion(self, shared_processor):
         """Test converting ContentFeed with multiple items."""
-        feed = ContentFeed(
-            channel=ContentChannel(title="Multi Feed", link="https://example.com"),
-            items=[
-                ContentItem(
-                    title="Article 1",
-                    link="https://example.com/1",
-                    description="Desc 1",
-                    pubDate="Mon, 01 Jan 2024 10:00:00 GMT",
-                ),
-                ContentItem(
-                    title="Article 2",
-                    link="https://example.com/2",
-                    description="Desc 2",
-                    pubDate="Mon, 01 Jan 2024 11:00:00 GMT",
-                ),
-                ContentItem(
-                    title="Article 3",
-                    link="https://example.com/3",
-                    description="Desc 3",
-                    pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
-                ),
-            ],
+        articles = shared_processor._content_feed_to_articles(
+            _MULTI_ITEM_FEED, "https://example.com"
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
-
         assert len(articles) == 3
         assert articles[0]["title"] == "Article 1"
         assert articles[1]["title"] == "Article 2"
         assert articles[2]["title"] == "Article 3"
 
-    def test_minimal_feed_handling(self):
-        """Test handling ContentFeed with minimal data."""
-        feed = ContentFeed(
-            channel=ContentChannel(title="Minimal Feed"),
-            items=[
-                ContentItem(
-                    title="Minimal Article",
-                    link="https://example.com/minimal",
-                )
-            ],
+    @pytest.mark.parametrize(
+        "field,expected",
+        [
+            ("title", "Minimal Article"),
+            ("link", "https://example.com/minimal"),
+            ("description", ""),
+            ("pubDate", ""),
+            ("source", "Minimal Feed"),
+        ],
+    )
+    def test_minimal_item_mapping(self, shared_processor, field, expected):
+        """Test every article field produced from a title-and-link-only item."""
+        articles = shared_processor._content_feed_to_articles(
+            _MINIMAL_FEED, "https://example.com"
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
-
         assert len(articles) == 1
-        assert isinstance(articles, list)
-        assert articles[0]["title"] == "Minimal Article"
+        assert articles[0][field] == expected
 
-    def test_source_title_extraction(self):
+    def test_source_title_extraction(self, shared_processor):
         """Test extracting source from ContentChannel.title."""
         feed = ContentFeed(
             channel=ContentChannel(title="My Custom Feed Title"),
             items=[ContentItem(title="Article", link="https://example.com/article")],
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
-
-        assert articles[0]["source"] == "My Custom Feed Title"
-
-    def test_no_pubdate_handling(self):
-        """Test that missing pubDate results in empty string."""
-        feed = ContentFeed(
-            channel=ContentChannel(title="Feed"),
-            items=[
-                ContentItem(
-                    title="No Date Article",
-                    link="https://example.com/nodate",
-                )
-            ],
+        articles = shared_processor._content_feed_to_articles(
+            feed, "https://example.com"
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
-
-        assert articles[0]["pubDate"] == ""
+        assert articles[0]["source"] == "My Custom Feed Title"
 
-    def test_field_mapping_completeness(self):
+    def test_field_mapping_completeness(self, shared_processor):
         """Test that all required fields map correctly."""
         feed = ContentFeed(
             channel=ContentChannel(
@@ -307,8 +338,9 @@ class TestContentFeedToArticlesConversion:
             ],
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
+        articles = shared_processor._content_feed_to_articles(
+            feed, "https://example.com"
+        )
 
         article = articles[0]
         assert "title" in article
@@ -317,29 +349,7 @@ class TestContentFeedToArticlesConversion:
         assert "pubDate" in article
         assert "source" in article
 
-    def test_minimal_required_fields_handling(self):
-        """Test handling of minimal required fields (title + link only)."""
-        feed = ContentFeed(
-            channel=ContentChannel(title="Feed"),
-            items=[
-                ContentItem(
-                    title="Minimal Article",
-                    link="https://example.com/minimal",
-                )
-            ],
-        )
-
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
-
-        assert len(articles) == 1
-        article = articles[0]
-        assert article["title"] == "Minimal Article"
-        assert article["link"] == "https://example.com/minimal"
-        assert article["description"] == ""
-        assert article["pubDate"] == ""
-
-    def test_source_url_fallback_when_no_channel_title(self):
+    def test_source_url_fallback_when_no_channel_title(self, shared_processor):
         """Test using source URL as fallback when channel title is empty."""
         source_url = "https://example.com/feed"
         feed = ContentFeed(
@@ -347,64 +357,29 @@ class TestContentFeedToArticlesConversion:
             items=[ContentItem(title="Article", link="https://example.com/article")],
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, source_url)
+        articles = shared_processor._content_feed_to_articles(feed, source_url)
 
         assert articles[0]["source"] == source_url
 
-    def test_special_characters_in_fields(self):
+    def test_special_characters_in_fields(self, shared_processor):
         """Test handling special characters in RSS fields."""
-        feed = ContentFeed(
-            channel=ContentChannel(title="Feed with & Special < Characters >"),
-            items=[
-                ContentItem(
-                    title="Title with 'quotes' and \"double quotes\"",
-                    link="https://example.com/article?param=value&other=123",
-                    description="Description with <html> tags & entities",
-                    pubDate="Mon, 01 Jan 2024 12:00:00 GMT",
-                )
-            ],
+        articles = shared_processor._content_feed_to_articles(
+            _SPECIAL_CHARS_FEED, "https://example.com"
         )
 
-        processor = _create_processor()
-        articles = processor._content_feed_to_articles(feed, "https://example.com")
-
         assert "&" in articles[0]["source"]
         assert "'" in articles[0]["title"]
         assert "&" in articles[0]["link"]
         assert "<html>" in articles[0]["description"]
 
 
-
-
 class TestProcessorDelegatesValidationToHiku:
     """Test that ContentProcessor delegates all validation to Hiku."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Mock configuration object."""
-        config = Mock()
-        config.openrouter_api_key = "test-key"
-        config.cookie_file_path = None
-        return config
-
-    @pytest.fixture
-    def mock_database(self):
-        """Mock database operations."""
-        db = Mock()
-        db.get_source_by_url.return_value = None
-        return db
-
-    @pytest.fixture
-    def processor(self, mock_config, mock_database):
-        """Create ContentProcessor instance with mocks."""
-        from yomu.content.processor import ContentProcessor
-
-        return ContentProcessor(mock_config, mock_database)
-
-    def test_processor_propagates_hiku_validation_errors(self, processor):
+    def test_processor_propagates_hiku_validation_errors(self, processor_factory):
         """Test that ContentProcessor propagates ValidationError from Hiku without catching it."""
         source_url = "https://example.com/invalid"
+        processor = processor_factory()
 
         with patch.object(processor.hiku_extractor, "extract") as mock_extract:
             mock_extract.side_effect = ValidationError.from_exception_data(
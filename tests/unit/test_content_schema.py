@@ -85,37 +85,36 @@ class TestHikuValidationIntegration:
     def test_hiku_adapter_propagates_pydantic_validation_errors(self):
         """Test that ContentProcessor does not catch Pydantic ValidationErrors from Hiku."""
         from yomu.content.processor import ContentProcessor
-        from unittest.mock import Mock, patch
-
-        config = Mock()
-        config.openrouter_api_key = "test-key"
-        config.cookie_file_path = None
-
-        with patch("yomu.content.processor.HikuExtractor") as mock_extractor_class:
-            mock_extractor = Mock()
-
-            mock_extractor.extract.side_effect = ValidationError.from_exception_data(
-                "ContentItem validation",
-                [
-                    {
-                        "type": "string_too_short",
-                        "loc": ("items", 0, "title"),
-                        "msg": "String should have at least 1 character",
-                        "input": "",
-                        "ctx": {"min_length": 1},
-                    }
-                ],
-            )
-            mock_extractor_class.return_value = mock_extractor
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+
+        config = SimpleNamespace(openrouter_api_key="test-key", cookie_file_path=None)
+
+        mock_extractor = Mock()
+
+        mock_extractor.extract.side_effect = ValidationError.from_exception_data(
+            "ContentItem validation",
+            [
+                {
+                    "type": "string_too_short",
+                    "loc": ("items", 0, "title"),
+                    "msg": "String should have at least 1 character",
+                    "input": "",
+                    "ctx": {"min_length": 1},
+                }
+            ],
+        )
 
-            processor = ContentProcessor(config=config, database=Mock())
+        processor = ContentProcessor(
+            config=config, database=Mock(), extractor=mock_extractor
+        )
 
-            with pytest.raises(ValidationError) as exc_info:
-                processor.process_source("https://example.com")
+        with pytest.raises(ValidationError) as exc_info:
+            processor.process_source("https://example.com")
 
-            errors = exc_info.value.errors()
-            assert len(errors) > 0
-            assert errors[0]["type"] == "string_too_short"
+        errors = exc_info.value.errors()
+        assert len(errors) > 0
+        assert errors[0]["type"] == "string_too_short"
 
 
 class TestValidationFieldDescriptions:
@@ -3,6 +3,7 @@
 
 import pytest
 import sqlite3
+from datetime import datetime
 from yomu.database.database import Database
 
 
@@ -39,6 +40,47 @@ class TestDatabaseSchema:
         assert "extraction_code" not in sources_columns
 
 
+class TestDatabasePragmas:
+    """Test connection tuning applied on open."""
+
+    def test_file_database_uses_wal_journal(self, tmp_path):
+        """Test that file-backed databases are switched to WAL with NORMAL sync."""
+        db = Database(str(tmp_path / "test.db"))
+        try:
+            journal_mode = db.connection.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = db.connection.execute("PRAGMA synchronous").fetchone()[0]
+            assert journal_mode == "wal"
+            assert synchronous == 1  # NORMAL
+        finally:
+            db.close()
+
+
+class TestFlushAndClose:
+    """Test releasing connections between daemon cycles."""
+
+    def test_flush_and_close_reopens_on_next_use(self, tmp_path):
+        """Test the connection is closed after flushing and reopened lazily."""
+        db_path = tmp_path / "test.db"
+        db = Database(str(db_path))
+        try:
+            db.create_tables()
+            db.upsert_source_run("https://example.com/feed", datetime(2024, 1, 1))
+
+            db.flush_and_close()
+
+            assert db.connection is None
+            wal_path = tmp_path / "test.db-wal"
+            assert not wal_path.exists() or wal_path.stat().st_size == 0
+
+            source = db.get_source_by_url("https://example.com/feed")
+            db.add_source("https://example.com/other")
+
+            assert source["last_successful_run"] == "2024-01-01T00:00:00"
+            assert db.connection is not None
+        finally:
+            db.close()
+
+
 class TestSourceOperations:
     """Test source CRUD operations."""
 
@@ -59,6 +101,61 @@ class TestSourceOperations:
         source = temp_db.get_source_by_url("https://nonexistent.com")
         assert source is None
 
+    def test_upsert_source_run_inserts_and_updates(self, temp_db):
+        """Test upsert creates a missing source and updates an existing one."""
+        temp_db.create_tables()
+        url = "https://example.com/feed"
+
+        temp_db.upsert_source_run(url, datetime(2024, 1, 1, 12, 0, 0))
+        assert temp_db.get_source_by_url(url)["last_successful_run"] == (
+            "2024-01-01T12:00:00"
+        )
+
+        temp_db.upsert_source_run(url, datetime(2024, 1, 2, 12, 0, 0))
+        assert temp_db.get_source_by_url(url)["last_successful_run"] == (
+            "2024-01-02T12:00:00"
+        )
+
+    def test_bulk_upsert_runs(self, temp_db):
+        """Test several source runs are recorded in one call."""
+        temp_db.create_tables()
+        url1 = "https://example.com/feed1"
+        url2 = "https://example.com/feed2"
+        temp_db.upsert_source_run(url1, datetime(2024, 1, 1, 12, 0, 0))
+
+        timestamp = datetime(2024, 1, 2, 12, 0, 0)
+        temp_db.bulk_upsert_runs([(url1, timestamp), (url2, timestamp)])
+
+        sources = temp_db.get_sources_by_urls([url1, url2])
+        assert sources[url1]["last_successful_run"] == "2024-01-02T12:00:00"
+        assert sources[url2]["last_successful_run"] == "2024-01-02T12:00:00"
+
+    def test_add_source_ignores_duplicates(self, temp_db):
+        """Test adding an existing source keeps its last run timestamp."""
+        temp_db.create_tables()
+        url = "https://example.com/feed"
+
+        temp_db.upsert_source_run(url, datetime(2024, 1, 1, 12, 0, 0))
+        temp_db.add_source(url)
+
+        assert temp_db.get_source_by_url(url)["last_successful_run"] == (
+            "2024-01-01T12:00:00"
+        )
+
+    def test_get_sources_by_urls(self, temp_db):
+        """Test batch lookup returns only existing sources keyed by URL."""
+        temp_db.create_tables()
+        url1 = "https://example.com/feed1"
+        url2 = "https://example.com/feed2"
+        temp_db.add_source(url1)
+        temp_db.add_source(url2)
+
+        sources = temp_db.get_sources_by_urls([url1, url2, "https://nonexistent.com"])
+
+        assert set(sources) == {url1, url2}
+        assert sources[url1]["url"] == url1
+        assert temp_db.get_sources_by_urls([]) == {}
+
 
 class TestDatabaseContextManager:
     """Test database connection management."""
@@ -4,18 +4,16 @@
 import pytest
 from unittest.mock import Mock, patch
 import smtplib
-from yomu.email.sender import EmailSender
+
+# Bound at import so spec= still sees the real class while tests patch smtplib.SMTP
+from smtplib import SMTP
+from yomu.email.sender import SMTP_TIMEOUT, EmailSender
 
 
 @pytest.fixture
-def mock_config():
-    """Mock configuration with sender credentials and SMTP settings."""
-    config = Mock()
-    config.sender_email = "test@gmail.com"
-    config.sender_password = "testpassword123"
-    config.smtp_server = "smtp.gmail.com"
-    config.smtp_port = 587
-    return config
+def mock_config(make_config):
+    """Config stub with sender credentials and SMTP settings."""
+    return make_config(sender_password="testpassword123")
 
 
 @pytest.fixture
@@ -30,7 +28,7 @@ class TestEmailSending:
     @patch("smtplib.SMTP")
     def test_send_email_success(self, mock_smtp_class, email_sender):
         """Test successful email sending."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
 
         to_email = "recipient@example.com"
@@ -39,7 +37,9 @@ class TestEmailSending:
 
         email_sender.send_email(to_email, subject, body)
 
-        mock_smtp_class.assert_called_once_with("smtp.gmail.com", 587)
+        mock_smtp_class.assert_called_once_with(
+            "smtp.gmail.com", 587, timeout=SMTP_TIMEOUT
+        )
         mock_server.starttls.assert_called_once()
         mock_server.login.assert_called_once_with("test@gmail.com", "testpassword123")
         mock_server.send_message.assert_called_once()
@@ -54,7 +54,7 @@ class TestEmailSending:
     @patch("smtplib.SMTP")
     def test_send_email_authentication_failure(self, mock_smtp_class, email_sender):
         """Test email sending with authentication failure."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
         mock_server.login.side_effect = smtplib.SMTPAuthenticationError(
             535, "Authentication failed"
@@ -80,7 +80,7 @@ class TestEmailSending:
     @patch("smtplib.SMTP")
     def test_send_email_recipient_failure(self, mock_smtp_class, email_sender):
         """Test email sending with recipient error."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
         mock_server.send_message.side_effect = smtplib.SMTPRecipientsRefused(
             {"test@example.com": (550, "User unknown")}
@@ -94,7 +94,7 @@ class TestEmailSending:
     @patch("smtplib.SMTP")
     def test_send_email_server_cleanup_on_error(self, mock_smtp_class, email_sender):
         """Test that SMTP server is properly cleaned up on errors."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
         mock_server.login.side_effect = smtplib.SMTPAuthenticationError(
             535, "Auth failed"
@@ -105,6 +105,21 @@ class TestEmailSending:
 
         mock_server.quit.assert_called_once()
 
+    @patch("smtplib.SMTP")
+    def test_injected_smtp_factory_used(self, mock_smtp_class, mock_config):
+        """Test that an injected factory opens the session instead of smtplib.SMTP."""
+        mock_server = Mock(spec=SMTP)
+        smtp_factory = Mock(return_value=mock_server)
+        sender = EmailSender(mock_config, smtp_factory=smtp_factory)
+
+        sender.send_email("a@example.com", "Subject", "Body")
+
+        smtp_factory.assert_called_once_with(
+            "smtp.gmail.com", 587, timeout=SMTP_TIMEOUT
+        )
+        mock_smtp_class.assert_not_called()
+        mock_server.send_message.assert_called_once()
+
 
 class TestEmailFormatting:
     """Test email message formatting."""
@@ -112,7 +127,7 @@ class TestEmailFormatting:
     @patch("smtplib.SMTP")
     def test_email_headers_formatting(self, mock_smtp_class, email_sender):
         """Test that email headers are properly formatted."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
 
         to_email = "recipient@example.com"
@@ -128,10 +143,25 @@ class TestEmailFormatting:
         assert "Date" in sent_message
         assert "Message-ID" in sent_message
 
+    @patch("smtplib.SMTP")
+    @patch("socket.getfqdn")
+    def test_message_id_uses_sender_domain(
+        self, mock_getfqdn, mock_smtp_class, email_sender
+    ):
+        """Test that Message-ID uses the sender's domain without a DNS lookup."""
+        mock_server = Mock(spec=SMTP)
+        mock_smtp_class.return_value = mock_server
+
+        email_sender.send_email("recipient@example.com", "Subject", "Body")
+
+        sent_message = mock_server.send_message.call_args[0][0]
+        assert sent_message["Message-ID"].endswith("@gmail.com>")
+        mock_getfqdn.assert_not_called()
+
     @patch("smtplib.SMTP")
     def test_email_body_encoding(self, mock_smtp_class, email_sender):
         """Test that email body handles unicode correctly."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
 
         unicode_body = "Unicode test: 你好世界 🌍"
@@ -144,7 +174,7 @@ class TestEmailFormatting:
     @patch("smtplib.SMTP")
     def test_multiline_body_formatting(self, mock_smtp_class, email_sender):
         """Test that multiline email bodies are handled correctly."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
 
         multiline_body = """Line 1
@@ -162,7 +192,7 @@ Line 3 with special chars: àéîöü"""
     @patch("smtplib.SMTP")
     def test_html_email_content_type(self, mock_smtp_class, email_sender):
         """Test that emails are sent as HTML content type."""
-        mock_server = Mock()
+        mock_server = Mock(spec=SMTP)
         mock_smtp_class.return_value = mock_server
 
         html_body = "<html><body><h1>HTML Newsletter</h1><p>Content</p></body></html>"
@@ -95,6 +95,31 @@ class TestHTMLTemplate:
         assert "Your Newsletter" in newsletter
         assert "You're receiving this newsletter" in newsletter
 
+    def test_empty_newsletter_identical_across_calls(self, template):
+        """Test the empty newsletter renders the same for every call and instance."""
+        first = template.generate_newsletter({})
+
+        assert template.generate_newsletter({}) == first
+        assert HTMLTemplate().generate_newsletter({}) == first
+        assert first.count("No new articles this time") == 1
+
+    def test_document_wrapper_shared_across_instances(self, template):
+        """Test empty and populated newsletters share one document wrapper."""
+        articles = {"Source": [{"title": "Post"}]}
+        other_template = HTMLTemplate()
+
+        first = template.generate_newsletter(articles)
+        second = other_template.generate_newsletter(articles)
+        empty = template.generate_newsletter({})
+
+        assert first == second
+        head = empty.split('<div class="header">')[0]
+        tail = empty.split('<div class="footer">')[1]
+        assert head.count("<style") == 1
+        assert first.startswith(head)
+        assert first.endswith(tail)
+        assert tail.endswith("</html>")
+
     def test_html_escaping(self, template):
         """Test that HTML content is properly escaped."""
         articles_with_html = {
@@ -120,6 +145,30 @@ class TestHTMLTemplate:
         assert "<script>" not in newsletter
         assert 'alert("xss")' not in newsletter
 
+    def test_source_header_quotes_escaped(self, template):
+        """Test that source names and URLs escape quotes and ampersands."""
+        articles = {
+            'Tom\'s "Blog" & Co': {
+                "url": 'https://example.com/?a=1&b="2"',
+                "articles": [{"title": "Post", "link": "https://example.com/p"}],
+            }
+        }
+
+        newsletter = template.generate_newsletter(articles)
+
+        assert "Tom&#x27;s &quot;Blog&quot; &amp; Co" in newsletter
+        assert 'href="https://example.com/?a=1&amp;b=&quot;2&quot;"' in newsletter
+
+    def test_article_link_escaped_for_attribute_context(self, template):
+        """Test that article links only escape what a quoted attribute needs."""
+        articles = {
+            "Source": [{"title": "Post", "link": "https://example.com/it's?a=1&b=<2>"}]
+        }
+
+        newsletter = template.generate_newsletter(articles)
+
+        assert 'href="https://example.com/it\'s?a=1&amp;b=&lt;2>"' in newsletter
+
     def test_article_without_optional_fields(self, template):
         """Test handling articles with missing optional fields."""
         minimal_articles = {"Simple Source": [{"title": "Minimal Article"}]}
@@ -57,7 +57,7 @@ class TestArgumentParsing:
 class TestDatabaseInitialization:
     """Test database initialization functionality."""
 
-    @patch("main.Database")
+    @patch("yomu.database.database.Database")
     def test_initialize_database_success(self, mock_database_class):
         """Test successful database initialization."""
         mock_db = Mock()
@@ -68,7 +68,7 @@ class TestDatabaseInitialization:
         mock_database_class.assert_called_once_with("test.db")
         mock_db.create_tables.assert_called_once()
 
-    @patch("main.Database")
+    @patch("yomu.database.database.Database")
     def test_initialize_database_existing_file(self, mock_database_class):
         """Test initialization with existing database file."""
         mock_db = Mock()
@@ -97,13 +97,11 @@ class TestYAMLConfigIntegration:
         }
 
     @pytest.fixture
-    def mock_env_config(self):
+    def mock_env_config(self, make_config):
         """Mock environment configuration."""
-        config = Mock()
-        config.openrouter_api_key = "test-api-key"
-        config.sender_email = "test@gmail.com"
-        config.sender_password = "test-password"
-        return config
+        return make_config(
+            openrouter_api_key="test-api-key", sender_password="test-password"
+        )
 
     def test_config_file_loading_success(self, sample_yaml_config):
         """Test successful YAML config file loading."""
@@ -156,13 +154,11 @@ class TestAppComponentCreation:
     """Test application component creation with YAML config integration."""
 
     @pytest.fixture
-    def mock_env_config(self):
+    def mock_env_config(self, make_config):
         """Mock environment configuration (no IMAP needed)."""
-        config = Mock()
-        config.openrouter_api_key = "test-api-key"
-        config.sender_email = "test@gmail.com"
-        config.sender_password = "test-password"
-        return config
+        return make_config(
+            openrouter_api_key="test-api-key", sender_password="test-password"
+        )
 
     @pytest.fixture
     def mock_yaml_config(self):
@@ -179,11 +175,11 @@ class TestAppComponentCreation:
             max_articles_per_source=3,
         )
 
-    @patch("main.Database")
-    @patch("main.EmailSender")
-    @patch("main.ContentProcessor")
-    @patch("main.NewsletterService")
-    @patch("main.NewsletterDaemon")
+    @patch("yomu.database.database.Database")
+    @patch("yomu.email.sender.EmailSender")
+    @patch("yomu.content.processor.ContentProcessor")
+    @patch("yomu.newsletter.service.NewsletterService")
+    @patch("yomu.daemon.daemon.NewsletterDaemon")
     def test_create_app_components_single_user_architecture(
         self,
         mock_daemon_class,
@@ -381,11 +377,21 @@ class TestMainFunction:
 
         assert result == 0
 
+    @patch("main.parse_arguments")
+    def test_main_version_fast_path(self, mock_parse_arguments, capsys):
+        """Test --version is answered before argument parsing."""
+        with patch("sys.argv", ["main.py", "--version"]):
+            result = main()
+
+        mock_parse_arguments.assert_not_called()
+        assert capsys.readouterr().out.strip() == "0.1.0"
+        assert result == 0
+
 
 class TestCacheClearingFunctions:
     """Test cache clearing helper functions."""
 
-    @patch("main.HikuDatabase")
+    @patch("hikugen.database.HikuDatabase")
     def test_clear_cache_for_keys_single_key(self, mock_hiku_db_class):
         """Test clear_cache_for_keys with single cache key."""
         from main import clear_cache_for_keys
@@ -401,7 +407,7 @@ class TestCacheClearingFunctions:
         mock_db.clear_cache_for_key.assert_called_once_with("https://example.com")
         assert result == 5
 
-    @patch("main.HikuDatabase")
+    @patch("hikugen.database.HikuDatabase")
     def test_clear_cache_for_keys_multiple_keys(self, mock_hiku_db_class):
         """Test clear_cache_for_keys with multiple cache keys."""
         from main import clear_cache_for_keys
@@ -423,7 +429,7 @@ class TestCacheClearingFunctions:
         assert mock_db.clear_cache_for_key.call_count == 3
         assert result == 9  # 3 + 2 + 4
 
-    @patch("main.HikuDatabase")
+    @patch("hikugen.database.HikuDatabase")
     def test_clear_cache_for_keys_returns_total_count(self, mock_hiku_db_class):
         """Test clear_cache_for_keys returns total deleted entries."""
         from main import clear_cache_for_keys
@@ -437,7 +443,7 @@ class TestCacheClearingFunctions:
         mock_db.create_tables.assert_called_once()
         assert result == 3  # Total from both keys
 
-    @patch("main.HikuDatabase")
+    @patch("hikugen.database.HikuDatabase")
     def test_clear_all_cache_calls_database_method(self, mock_hiku_db_class):
         """Test clear_all_cache calls database method."""
         from main import clear_all_cache
@@ -1,9 +1,11 @@
 # ABOUTME: Tests for NewsletterService combining generation and distribution
 # ABOUTME: Validates the unified newsletter workflow from source processing to email delivery
 
-from unittest.mock import Mock
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
-from yomu.newsletter.service import NewsletterService
+from yomu.newsletter.service import MAX_SOURCE_WORKERS, NewsletterService
 from yomu.config.config import Config
 
 
@@ -46,6 +48,94 @@ class TestNewsletterService:
         assert "Your Newsletter" in call_args[1]  # Subject
         assert isinstance(call_args[2], str)  # HTML content
 
+    def test_collect_articles_prefetches_source_metadata_once(self):
+        """Test source metadata is fetched in one batch and passed to the processor."""
+        known_sources = {"https://source1.com": {"last_successful_run": None}}
+        self.source_processor.database.get_sources_by_urls.return_value = known_sources
+        self.source_processor.process_source.return_value = []
+
+        self.newsletter_service._collect_articles_from_sources(
+            ["https://source1.com", "https://source2.com"]
+        )
+
+        self.source_processor.database.get_sources_by_urls.assert_called_once_with(
+            ["https://source1.com", "https://source2.com"]
+        )
+        for call in self.source_processor.process_source.call_args_list:
+            assert call[0][1] is known_sources
+
+    def test_collect_articles_processes_sources_concurrently(self):
+        """Test sources are processed in parallel while keeping config order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def mock_process_source(url, known_sources=None, record_run=True, limit=None):
+            barrier.wait()  # Deadlocks (times out) if sources run sequentially
+            return [{"title": url, "source": url}]
+
+        self.source_processor.process_source.side_effect = mock_process_source
+
+        articles_by_source = self.newsletter_service._collect_articles_from_sources(
+            ["https://source2.com", "https://source1.com"]
+        )
+
+        assert list(articles_by_source) == [
+            "https://source2.com",
+            "https://source1.com",
+        ]
+
+    def test_collect_articles_caps_worker_pool(self):
+        """Test the pool never exceeds the source count or the worker cap."""
+        self.source_processor.process_source.return_value = []
+
+        with patch(
+            "yomu.newsletter.service.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_pool:
+            self.newsletter_service._collect_articles_from_sources(
+                [f"https://source{i}.com" for i in range(MAX_SOURCE_WORKERS + 4)]
+            )
+            self.newsletter_service._collect_articles_from_sources(
+                ["https://source1.com", "https://source2.com"]
+            )
+
+        assert [call.kwargs["max_workers"] for call in mock_pool.call_args_list] == [
+            MAX_SOURCE_WORKERS,
+            2,
+        ]
+
+    def test_collect_articles_closes_extractors_after_pool(self):
+        """Test the workers' extractors are closed once every source is processed."""
+        self.source_processor.process_source.return_value = []
+
+        self.newsletter_service._collect_articles_from_sources(
+            ["https://source1.com", "https://source2.com"]
+        )
+
+        calls = [
+            name
+            for name, _, _ in self.source_processor.mock_calls
+            if name in ("process_source", "close_extractors")
+        ]
+        assert calls == ["process_source", "process_source", "close_extractors"]
+
+    def test_collect_articles_records_runs_for_successful_sources(self):
+        """Test only successfully processed sources are checkpointed, in one batch."""
+
+        def mock_process_source(url, known_sources=None, record_run=True, limit=None):
+            assert record_run is False
+            if url == "https://broken.com":
+                raise Exception("Extraction failed")
+            return []
+
+        self.source_processor.process_source.side_effect = mock_process_source
+
+        self.newsletter_service._collect_articles_from_sources(
+            ["https://source1.com", "https://broken.com"]
+        )
+
+        self.source_processor.database.bulk_upsert_runs.assert_called_once()
+        runs = list(self.source_processor.database.bulk_upsert_runs.call_args[0][0])
+        assert [url for url, _ in runs] == ["https://source1.com"]
+
     def test_send_newsletter_to_user_empty_sources(self):
         """Test sending newsletter with no sources returns False."""
         result = self.newsletter_service.send_newsletter_to_user("test@example.com", [])
@@ -165,7 +255,7 @@ class TestNewsletterService:
         mock_articles_1 = [{"title": "Article 1", "source": "Source One"}]
         mock_articles_2 = [{"title": "Article 2", "source": "Source Two"}]
 
-        def mock_process_source(url):
+        def mock_process_source(url, known_sources=None, record_run=True, limit=None):
             if url == "https://source1.com":
                 return mock_articles_1
             elif url == "https://source2.com":
@@ -0,0 +1,114 @@
+# ABOUTME: Test suite for shared utility helpers
+# ABOUTME: Tests date parsing, readable date formatting, and description truncation
+
+from datetime import datetime, timezone
+from yomu.utils import (
+    format_readable_date,
+    parse_date,
+    parse_iso_timestamp,
+    truncate_description,
+)
+
+
+class TestParseDate:
+    """Test publication date parsing across feed formats."""
+
+    def test_rfc822_with_zone_name(self):
+        """RFC 822 dates with a zone name parse to the stated wall time."""
+        assert parse_date("Mon, 01 Jan 2024 10:00:00 GMT") == datetime(
+            2024, 1, 1, 10, 0, 0
+        )
+
+    def test_rfc822_with_offset(self):
+        """RFC 822 dates with a numeric offset keep the offset."""
+        parsed = parse_date("Mon, 01 Jan 2024 10:00:00 +0200")
+
+        assert parsed.utcoffset().total_seconds() == 7200
+
+    def test_iso_with_trailing_z_is_utc(self):
+        """A trailing Z is read as UTC."""
+        parsed = parse_date("2024-01-01T10:00:00Z")
+
+        assert parsed == datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+    def test_iso_variants(self):
+        """Offset, fractional-second, space-separated and date-only ISO forms parse."""
+        assert parse_date("2024-01-01T10:00:00+05:00").hour == 10
+        assert parse_date("2024-01-01T10:00:00.123Z").microsecond == 123000
+        assert parse_date("2024-01-01 10:00:00") == datetime(2024, 1, 1, 10, 0, 0)
+        assert parse_date("2024-01-01") == datetime(2024, 1, 1)
+
+    def test_unparseable_and_blank(self):
+        """Garbage, blank and None inputs return None."""
+        assert parse_date("not a date") is None
+        assert parse_date("2024-13-45T99:00:00Z") is None
+        assert parse_date("   ") is None
+        assert parse_date(None) is None
+
+    def test_surrounding_whitespace_ignored(self):
+        """Leading and trailing whitespace is stripped before parsing."""
+        assert parse_date("  2024-01-01T10:00:00Z\n") == datetime(
+            2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc
+        )
+
+
+class TestFormatReadableDate:
+    """Test human-readable date formatting."""
+
+    def test_formats_rfc822_and_iso_identically(self):
+        """The same instant in different formats renders the same text."""
+        expected = "January 01, 2024 at 10:00 AM"
+
+        assert format_readable_date("Mon, 01 Jan 2024 10:00:00 GMT") == expected
+        assert format_readable_date("2024-01-01T10:00:00Z") == expected
+
+    def test_unparseable_returns_none(self):
+        """Unparseable input returns None."""
+        assert format_readable_date("yesterday") is None
+        assert format_readable_date("") is None
+
+
+class TestTruncateDescription:
+    """Test description truncation at word boundaries."""
+
+    def test_short_text_unchanged(self):
+        """Text within the limit is returned as is."""
+        assert truncate_description("short text", 20) == "short text"
+
+    def test_cuts_at_last_word_boundary(self):
+        """Truncation backs up to the last space before adding the ellipsis."""
+        assert truncate_description("hello brave new world", 15) == "hello brave..."
+
+    def test_no_space_cuts_mid_word(self):
+        """Text without usable spaces is cut at the limit."""
+        assert truncate_description("abcdefghijkl", 8) == "abcde..."
+        assert truncate_description(" abcdefghijkl", 8) == " abcd..."
+
+    def test_tiny_and_empty_limits(self):
+        """Limits too small for text return a partial ellipsis or nothing."""
+        assert truncate_description("hello world", 2) == ".."
+        assert truncate_description("hello world", 0) == ""
+        assert truncate_description("", 10) == ""
+
+
+class TestDateCaching:
+    """Test memoization of the date helpers."""
+
+    def test_repeated_dates_are_parsed_once(self):
+        """Formatting the same date twice hits the cache the second time."""
+        format_readable_date.cache_clear()
+
+        first = format_readable_date("Tue, 02 Jan 2024 08:30:00 GMT")
+        second = format_readable_date("Tue, 02 Jan 2024 08:30:00 GMT")
+
+        assert first == second == "January 02, 2024 at 08:30 AM"
+        info = format_readable_date.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_cached_none_results(self):
+        """Missing and unparseable inputs are cached as None."""
+        assert parse_iso_timestamp(None) is None
+        assert parse_iso_timestamp("garbage") is None
+        assert parse_iso_timestamp("2024-01-01T10:00:00") == datetime(
+            2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc
+        )